@@ -1,24 +1,32 @@
 # Internal
 import sys
 import typing as T
-import traceback
 from os import environ
-from argparse import ArgumentParser
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from contextlib import contextmanager
+from importlib import import_module
 
-# External
-import typing_extensions as Te
+if T.TYPE_CHECKING:
+    # External
+    import typing_extensions as Te
 
-# External
-from othello.views import ConsoleView
-from othello.abstract import AbstractView, AbstractTrainingView
-from othello.misc.error_dialog import gui_error
+    # External
+    from othello.abstract import AbstractView
 
-view_list: T.Dict[str, T.Sequence[T.Type[AbstractView]]] = {
+# Views are referenced as "module:class" and only imported after the arguments are parsed
+view_list: T.Dict[str, T.Sequence[str]] = {
     "gui": tuple(),
-    "console": (ConsoleView,),
+    "console": ("othello.views.console_view:ConsoleView",),
 }
 
-arg_parser = ArgumentParser(description="Simula partidas do jogo Otello")
+# Other tools have their own entry points, so any name can still be given as CAMINHO
+arg_parser = ArgumentParser(
+    description="Simula partidas do jogo Otello",
+    epilog="outros comandos:\n"
+    "  othello-replay  Verifica partidas gravadas com --resultados\n"
+    "  othello-bench   Mede o ganho de jogar partidas em paralelo",
+    formatter_class=RawDescriptionHelpFormatter,
+)
 arg_parser.add_argument(
     "player_paths",
     type=str,
@@ -32,6 +40,118 @@ arg_parser.add_argument(
     help="Passa para próxima jogada automaticamente",
     action="store_true",
 )
+arg_parser.add_argument(
+    "--silencioso",
+    dest="quiet",
+    help="Não mostra o tabuleiro durante as partidas, apenas o resultado final",
+    action="store_true",
+)
+arg_parser.add_argument(
+    "--quadros-por-segundo",
+    dest="max_fps",
+    type=float,
+    default=0,
+    help="Limita quantas vezes por segundo o tabuleiro é mostrado no modo automático",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--partidas",
+    dest="games",
+    type=int,
+    default=1,
+    help="Joga N partidas entre os jogadores escolhidos, alternando as cores",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--sprt",
+    dest="sprt",
+    type=float,
+    nargs=2,
+    help="Encerra as partidas assim que o SPRT decidir entre as hipóteses de diferença de Elo "
+    "ELO0 e ELO1",
+    metavar=("ELO0", "ELO1"),
+)
+arg_parser.add_argument(
+    "--checkpoint",
+    dest="checkpoint_path",
+    help="Registra o progresso das partidas no arquivo e retoma dele caso já exista",
+    metavar="ARQUIVO",
+)
+arg_parser.add_argument(
+    "--resultados",
+    dest="results_path",
+    help="Acrescenta o resultado de cada partida ao arquivo (.jsonl ou .csv)",
+    metavar="ARQUIVO",
+)
+arg_parser.add_argument(
+    "--tamanho",
+    type=int,
+    dest="size",
+    default=8,
+    choices=range(4, 17, 2),
+    help="Joga em um tabuleiro de N por N casas",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--semente",
+    type=int,
+    dest="seed",
+    help="Semente usada para derivar a semente de cada partida, tornando-as reproduzíveis",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--tempo",
+    type=float,
+    dest="time_control",
+    default=0.0,
+    help="Dá a cada jogador um relógio com SEGUNDOS para a partida inteira, quem esgotar o "
+    "tempo perde por W/O",
+    metavar="SEGUNDOS",
+)
+arg_parser.add_argument(
+    "--incremento",
+    type=float,
+    dest="increment",
+    default=0.0,
+    help="Acrescenta SEGUNDOS ao relógio do jogador após cada jogada, usado com --tempo",
+    metavar="SEGUNDOS",
+)
+arg_parser.add_argument(
+    "--adjudicar",
+    type=int,
+    dest="adjudicate",
+    default=0,
+    help="Encerra partidas com N ou menos casas vazias assim que o resultado estiver decidido, "
+    "sem jogá-las até o fim",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--ponderar",
+    dest="ponder",
+    help="Permite que jogadores com o método ponder pensem durante a vez do oponente",
+    action="store_true",
+)
+arg_parser.add_argument(
+    "--metricas",
+    dest="metrics_path",
+    help="Salva tempo, CPU e memória de cada jogador por fase do jogo (.json ou .csv)",
+    metavar="ARQUIVO",
+)
+arg_parser.add_argument(
+    "--perfil",
+    dest="profile_dir",
+    nargs="?",
+    const=".",
+    help="Salva um perfil do cProfile para cada jogador no diretório informado",
+    metavar="DIRETORIO",
+)
+arg_parser.add_argument(
+    "--contadores",
+    dest="board_counters",
+    help="Conta chamadas e tempo gasto em cada método do tabuleiro, mostrando um relatório ao "
+    "final",
+    action="store_true",
+)
 arg_parser.add_argument(
     "--depurar",
     dest="debug",
@@ -44,19 +164,62 @@ arg_parser.add_argument(
     help="Habilita modo de treinamento de um jogador",
     action="store_true",
 )
+arg_parser.add_argument(
+    "--memoria",
+    type=int,
+    dest="replay_capacity",
+    default=0,
+    help="No treinamento, guarda as últimas N posições jogadas em uma memória compartilhada, "
+    "recebida por game_over como replay_buffer",
+    metavar="N",
+)
+arg_parser.add_argument(
+    "--memoria-arquivo",
+    dest="replay_path",
+    help="Mantém a memória de treino no arquivo (.npy), em vez da RAM, entre treinos",
+    metavar="ARQUIVO",
+)
 
 debug = True
 
 
+def load_view(view_path: str) -> T.Type["AbstractView"]:
+    module_name, _, class_name = view_path.partition(":")
+    view_cls: T.Type["AbstractView"] = getattr(import_module(module_name), class_name)
+    return view_cls
+
+
+@contextmanager
+def reporting_board_calls(enabled: bool) -> T.Iterator[None]:
+    # Counters are printed to stderr once the loop ends, however it ends
+    if not enabled:
+        yield
+        return
+
+    # External
+    from othello.misc.board_counters import count_board_calls
+
+    with count_board_calls() as counters:
+        try:
+            yield
+        finally:
+            print(counters.report(), file=sys.stderr)
+
+
 def main(view_type: str) -> None:
     global debug
 
     namespace = arg_parser.parse_args()
     debug = namespace.debug
+    # Not a view option, handled here around the whole loop
+    board_counters = vars(namespace).pop("board_counters")
+
+    # External
+    from othello.abstract import AbstractTrainingView
 
     view = None
     training = namespace.training
-    views_iter = iter(view for view in view_list[view_type] if view.available())
+    views_iter = iter(view for view in map(load_view, view_list[view_type]) if view.available())
     while view is None:
         try:
             view_cls = next(views_iter)
@@ -69,12 +232,15 @@ def main(view_type: str) -> None:
             break
         except Exception:
             if debug:
+                import traceback
+
                 traceback.print_exc()
 
             view = None
     else:
         try:
-            return view.training_loop() if training else view.loop()
+            with reporting_board_calls(board_counters):
+                return view.training_loop() if training else view.loop()
         except KeyboardInterrupt:
             print()
             pass
@@ -86,7 +252,14 @@ def error_msg(exc: BaseException) -> str:
     return f"Falha irrecuperável\nRazão: {exc}"
 
 
-def main_gui() -> Te.NoReturn:
+def gui_error(msg: str) -> None:
+    # External
+    from othello.misc.error_dialog import gui_error
+
+    gui_error(msg)
+
+
+def main_gui() -> "Te.NoReturn":
     try:
         main("gui")
     except BaseException as exc:
@@ -100,7 +273,7 @@ def main_gui() -> Te.NoReturn:
     sys.exit(0)
 
 
-def main_console() -> Te.NoReturn:
+def main_console() -> "Te.NoReturn":
     try:
         main("console")
     except BaseException as exc:
@@ -1,4 +1,9 @@
 # Project
 from .view import AbstractView, AbstractTrainingView
-from .player import PlayerProtocol, ColoredPlayerProtocol
+from .player import (
+    PlayerProtocol,
+    AsyncPlayerProtocol,
+    ColoredPlayerProtocol,
+    PonderingPlayerProtocol,
+)
 from .training_player import TrainingPlayerProtocol
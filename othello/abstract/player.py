@@ -5,6 +5,9 @@ import typing as T
 import typing_extensions as Te
 
 if T.TYPE_CHECKING:
+    # Internal
+    from threading import Event
+
     # Project
     from ..enums import Color
     from ..models import Board
@@ -19,6 +22,25 @@ class PlayerProtocol(Te.Protocol):
         ...
 
 
+@Te.runtime
+class AsyncPlayerProtocol(Te.Protocol):
+    def __init__(self, __color: "Color"):
+        ...
+
+    async def play(self, __board: "Board", **__kwargs: T.Any) -> T.Tuple[int, int]:
+        ...
+
+
+@Te.runtime
+class PonderingPlayerProtocol(PlayerProtocol, Te.Protocol):
+    # Runs in a background thread while the opponent thinks, it must return soon after stop is
+    # set. The result may map opponent moves to the replies they should get without calling play
+    def ponder(
+        self, __board: "Board", __stop: "Event"
+    ) -> T.Optional[T.Mapping[T.Tuple[int, int], T.Tuple[int, int]]]:
+        ...
+
+
 class ColoredPlayerProtocol(PlayerProtocol, Te.Protocol):
     color: "Color"
 
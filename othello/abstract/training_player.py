@@ -15,5 +15,7 @@ if T.TYPE_CHECKING:
 
 @Te.runtime
 class TrainingPlayerProtocol(PlayerProtocol, Te.Protocol):
+    # Players training with --memoria may also declare a replay_buffer keyword (or **kwargs),
+    # the adapter only passes it when the signature accepts it, so it isn't part of the protocol
     def game_over(self, __winner: T.Optional["Color"], __board: "Board") -> None:
         ...
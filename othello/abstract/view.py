@@ -2,6 +2,14 @@
 import typing as T
 from abc import ABCMeta, abstractmethod
 
+if T.TYPE_CHECKING:
+    # Project
+    from ..misc.clock import GameClock
+    from ..misc.profiler import PlayerProfiler
+    from ..misc.result_sink import ResultSink
+    from ..models.proof_search import Adjudicator
+    from ..models.replay_buffer import ReplayBuffer
+
 # Type generics
 K = T.TypeVar("K", bound="AbstractView")
 
@@ -32,10 +40,86 @@ class AbstractView(metaclass=ABCMeta):
         player_paths: T.Optional[T.Sequence[str]] = None,
         automatic: bool = False,
         debug: bool = False,
+        quiet: bool = False,
+        max_fps: float = 0,
+        metrics_path: T.Optional[str] = None,
+        profile_dir: T.Optional[str] = None,
+        ponder: bool = False,
+        games: int = 1,
+        sprt: T.Optional[T.Tuple[float, float]] = None,
+        checkpoint_path: T.Optional[str] = None,
+        results_path: T.Optional[str] = None,
+        seed: T.Optional[int] = None,
+        size: int = 8,
+        adjudicate: int = 0,
+        time_control: float = 0.0,
+        increment: float = 0.0,
     ) -> None:
+        self.size = size
+        self.adjudicate = adjudicate
+        self.time_control = time_control
+        self.increment = increment
+        self.seed = seed
+        self.checkpoint_path = checkpoint_path
+        self.sprt = sprt
+        self.games = games
         self.debug = debug
+        self.ponder = ponder
+        self.quiet = quiet
+        self.max_fps = max_fps
         self.automatic = automatic
         self.player_paths = player_paths or tuple()
+        self.metrics_path = metrics_path
+
+        self.profiler: T.Optional["PlayerProfiler"] = None
+        if metrics_path or profile_dir:
+            from ..misc.profiler import PlayerProfiler
+
+            self.profiler = PlayerProfiler(cprofile_dir=profile_dir)
+
+        self.result_sink: T.Optional["ResultSink"] = None
+        if results_path:
+            from ..misc.result_sink import open_sink
+
+            self.result_sink = open_sink(results_path)
+
+    def save_profiling(self) -> None:
+        if self.profiler is None:
+            return
+
+        if self.metrics_path:
+            self.profiler.export(self.metrics_path)
+
+        self.profiler.dump_profiles()
+
+    def game_seed(self, game: int) -> T.Optional[int]:
+        if self.seed is None:
+            return None
+
+        from ..misc.seeding import derive_seed
+
+        return derive_seed(self.seed, game)
+
+    def adjudicator(self) -> T.Optional["Adjudicator"]:
+        if not self.adjudicate:
+            return None
+
+        from ..models.proof_search import Adjudicator
+
+        return Adjudicator(max_empties=self.adjudicate)
+
+    def game_clock(self) -> T.Optional["GameClock"]:
+        # A new clock for each game, None plays without time control
+        if not self.time_control:
+            return None
+
+        from ..misc.clock import GameClock
+
+        return GameClock(self.time_control, self.increment)
+
+    def close_results(self) -> None:
+        if self.result_sink is not None:
+            self.result_sink.close()
 
     @abstractmethod
     def loop(self) -> None:
@@ -51,9 +135,26 @@ class AbstractView(metaclass=ABCMeta):
 
 
 class AbstractTrainingView(AbstractView, metaclass=ABCMeta):
-    def __init__(self, *args, training: bool, **kwargs) -> None:
+    def __init__(
+        self,
+        *args: T.Any,
+        training: bool,
+        replay_capacity: int = 0,
+        replay_path: T.Optional[str] = None,
+        **kwargs: T.Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.training = training
+        self.replay_capacity = replay_capacity
+        self.replay_path = replay_path
+
+    def replay_buffer(self) -> T.Optional["ReplayBuffer"]:
+        if not self.replay_capacity:
+            return None
+
+        from ..models.replay_buffer import ReplayBuffer
+
+        return ReplayBuffer(self.replay_capacity, self.replay_path, self.seed)
 
     @abstractmethod
     def training_loop(self) -> None:
@@ -1,3 +1,22 @@
+# Internal
+import typing as T
+
 # Project
-from .board_adapter import BoardAdapter
-from .board_training_adapter import BoardTrainingAdapter
+from ..misc.lazy_import import lazy_attributes
+
+if T.TYPE_CHECKING:
+    # Project
+    from .board_adapter import BoardAdapter
+    from .async_board_adapter import AsyncBoardAdapter
+    from .board_training_adapter import BoardTrainingAdapter
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "BoardAdapter": ".board_adapter",
+        "AsyncBoardAdapter": ".async_board_adapter",
+        "BoardTrainingAdapter": ".board_training_adapter",
+    },
+)
+
+__all__ = ("BoardAdapter", "AsyncBoardAdapter", "BoardTrainingAdapter")
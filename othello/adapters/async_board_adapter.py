@@ -0,0 +1,147 @@
+# Internal
+import math
+import asyncio
+import typing as T
+from inspect import iscoroutinefunction
+from concurrent.futures import Executor
+
+# Project
+from ..models import Board
+from ..abstract import AbstractView, PlayerProtocol
+from .board_adapter import BoardAdapter
+from ..misc.seeding import derive_seed
+
+if T.TYPE_CHECKING:
+    # Internal
+    from pkgutil import ModuleInfo
+
+    # Project
+    from ..misc.clock import ClockState
+    from ..misc.result_sink import ResultSink
+
+# Type generics
+Player_t = T.Union["ModuleInfo", PlayerProtocol]
+
+
+class AsyncBoardAdapter(BoardAdapter):
+    def __init__(
+        self,
+        black: Player_t,
+        white: Player_t,
+        move_timeout: T.Optional[float] = None,
+        executor: T.Optional[Executor] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(black, white, **kwargs)
+
+        self.move_timeout = move_timeout
+        self._executor = executor
+
+    async def update_async(self, view: T.Optional[AbstractView] = None) -> bool:
+        loop = asyncio.get_running_loop()
+        color = self._current_player.color
+        task = self._pondering.pop(color, None)
+        # Stopping waits for the pondering thread, which must not block the other games
+        replies = await loop.run_in_executor(self._executor, task.stop) if task else None
+        move: T.Optional[T.Tuple[int, int]] = None
+
+        if self._has_moves(color):
+            clock_state = self._start_clock(color)
+            timeout = self.move_timeout
+            if clock_state is not None:
+                # Whatever is left on the clock also bounds the move
+                timeout = min(timeout or math.inf, max(0.0, clock_state.remaining))
+
+            # Includes asyncio.TimeoutError, running out of time is a W/O
+            with self._failing_on_error(color):
+                move = self._pondered_move(replies, color)
+                if move is None:
+                    with self._timing(color):
+                        move = await asyncio.wait_for(
+                            self._current_player_async_play(
+                                self._board.get_clone(), view, clock_state
+                            ),
+                            timeout,
+                        )
+
+                self._play_move(move, color)
+
+        return self._end_turn(move, color)
+
+    async def _current_player_async_play(
+        self,
+        board: Board,
+        view: T.Optional[AbstractView],
+        clock: T.Optional["ClockState"] = None,
+    ) -> T.Tuple[int, int]:
+        player = self._current_player
+        # Players may provide a coroutine as play, or alongside it as play_async
+        play = getattr(player, "play_async", player.play)
+        # Only plays are measured, the engine time of an update would include every other game
+        # running on the loop
+        measure = self._measure_play()
+
+        if iscoroutinefunction(play):
+            with measure:
+                move: T.Tuple[int, int] = await self._call_play(play, board, view, clock)
+            return move
+
+        def blocking_play() -> T.Tuple[int, int]:
+            # Measured in the thread that runs the player, where cProfile can see its calls
+            with measure:
+                return T.cast(T.Tuple[int, int], self._call_play(play, board, view, clock))
+
+        # Blocking players run in a thread, so they don't stall every other game
+        return await asyncio.get_running_loop().run_in_executor(self._executor, blocking_play)
+
+
+async def play_game(
+    adapter: AsyncBoardAdapter, view: T.Optional[AbstractView] = None
+) -> AsyncBoardAdapter:
+    while not adapter.finished():
+        try:
+            await adapter.update_async(view)
+        except Exception:
+            # The adapter registered the failure, the game ends by W/O
+            break
+
+    return adapter
+
+
+async def play_games(
+    games: T.Iterable[T.Tuple[Player_t, Player_t]],
+    concurrency: int = 100,
+    move_timeout: T.Optional[float] = None,
+    executor: T.Optional[Executor] = None,
+    view: T.Optional[AbstractView] = None,
+    sink: T.Optional["ResultSink"] = None,
+    seed: T.Optional[int] = None,
+    size: int = Board.SIZE,
+) -> T.List[AsyncBoardAdapter]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_game(index: int, black: Player_t, white: Player_t) -> AsyncBoardAdapter:
+        # Seeds depend only on the game index, not on the order games get scheduled
+        game_seed = None if seed is None else derive_seed(seed, index)
+        async with semaphore:
+            return await play_game(
+                AsyncBoardAdapter(
+                    black, white, move_timeout, executor, sink=sink, seed=game_seed, size=size
+                ),
+                view,
+            )
+
+    return list(
+        await asyncio.gather(
+            *(bounded_game(index, black, white) for index, (black, white) in enumerate(games))
+        )
+    )
+
+
+def run_games(
+    games: T.Iterable[T.Tuple[Player_t, Player_t]], **kwargs: T.Any
+) -> T.List[AsyncBoardAdapter]:
+    return asyncio.run(play_games(games, **kwargs))
+
+
+__all__ = ("AsyncBoardAdapter", "play_game", "play_games", "run_games")
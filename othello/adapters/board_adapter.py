@@ -1,17 +1,29 @@
 # Internal
+import time
 import typing as T
 from inspect import signature
+from contextlib import nullcontext, contextmanager
 
 # Project
 from ..enums import Color
-from ..models import Board
+from ..models import Board, GameResult
+from ..models.game_result import format_moves
+from .ponder import PonderTask
 from ..abstract import AbstractView, PlayerProtocol, ColoredPlayerProtocol
+from ..misc.seeding import derive_seed, seed_player
 from ..misc.runtime_importer import import_player
 
 if T.TYPE_CHECKING:
     # Internal
     from pkgutil import ModuleInfo
 
+    # Project
+    from ..abstract import PonderingPlayerProtocol
+    from ..misc.profiler import PlayerProfiler
+    from ..misc.clock import GameClock, ClockState
+    from ..misc.result_sink import ResultSink
+    from ..models.proof_search import Adjudicator
+
 
 class Players(T.NamedTuple):
     black: ColoredPlayerProtocol
@@ -26,6 +38,14 @@ class BoardAdapter:
         self,
         black: T.Union["ModuleInfo", PlayerProtocol],
         white: T.Union["ModuleInfo", PlayerProtocol],
+        profiler: T.Optional["PlayerProfiler"] = None,
+        ponder: bool = False,
+        sink: T.Optional["ResultSink"] = None,
+        names: T.Optional[T.Tuple[str, str]] = None,
+        seed: T.Optional[int] = None,
+        size: int = Board.SIZE,
+        adjudicator: T.Optional["Adjudicator"] = None,
+        clock: T.Optional["GameClock"] = None,
     ) -> None:
         black_player = (
             black
@@ -41,21 +61,48 @@ class BoardAdapter:
         # Validate players
         assert hasattr(black_player, "color") and hasattr(white_player, "color")
 
+        if seed is not None:
+            # Each side gets its own seed, derived from the game one
+            seed_player(black_player, derive_seed(seed, 1))
+            seed_player(white_player, derive_seed(seed, 2))
+
         # Internal
-        self._board = Board(None)
+        self._board = Board(None, size)
         self._failure: T.Optional[Color] = None
+        self._profiler = profiler
+        self._ponder = ponder
+        self._pondering: T.Dict[Color, PonderTask] = {}
+        self._last_move: T.Optional[T.Tuple[int, int]] = None
+        self._sink = sink
+        self.seed = seed
+        self._game_ended = False
+        self._moves: T.List[T.Tuple[int, int]] = []
+        self._times = {Color.BLACK: 0.0, Color.WHITE: 0.0}
+        self._adjudicator = adjudicator
+        self.clock = clock
+        # Result found by the adjudicator, a game it decided ends right away
+        self._adjudicated = False
+        self._adjudicated_winner: T.Optional[Color] = None
+        self.names = names or (self._player_name(black), self._player_name(white))
         self._players = Players(
             T.cast(ColoredPlayerProtocol, black_player),
             T.cast(ColoredPlayerProtocol, white_player),
         )
         self._current_player = self._players.black
 
+    @staticmethod
+    def _player_name(player: T.Union["ModuleInfo", PlayerProtocol]) -> str:
+        return type(player).__name__ if isinstance(player, PlayerProtocol) else player.name
+
     @property
     def score(self) -> T.Mapping[Color, int]:
         return dict(zip((Color.WHITE, Color.BLACK), self._board.score()))
 
     @property
     def winner(self) -> T.Optional[Color]:
+        if self._adjudicated:
+            return self._adjudicated_winner
+
         return (
             self._failure.opposite()
             if self._failure
@@ -72,11 +119,55 @@ class BoardAdapter:
 
     @property
     def view_data(self) -> T.Sequence[T.Sequence[Color]]:
-        return tuple(column[1:9] for column in self._board)[1:9]
+        size = self._board.size
+        return tuple(column[1 : size + 1] for column in self._board)[1 : size + 1]
+
+    @property
+    def size(self) -> int:
+        return self._board.size
+
+    @property
+    def adjudicated(self) -> bool:
+        return self._adjudicated
 
     def finished(self) -> bool:
-        return self._failure is not None or not (
-            self._has_moves(Color.WHITE) or self._has_moves(Color.BLACK)
+        is_finished = (
+            self._failure is not None
+            or self._adjudicated
+            or not (self._has_moves(Color.WHITE) or self._has_moves(Color.BLACK))
+        )
+
+        if is_finished and not self._game_ended:
+            self._game_ended = True
+            self._game_over()
+
+        return is_finished
+
+    def _game_over(self) -> None:
+        # Called only once, the first time finished returns True
+        for task in self._pondering.values():
+            task.stop()
+        self._pondering.clear()
+
+        if self._sink is not None:
+            self._sink.write(self.result())
+
+    def result(self, black: T.Optional[str] = None, white: T.Optional[str] = None) -> GameResult:
+        white_score, black_score = self._board.score()
+        return GameResult(
+            black=black or self.names[0],
+            white=white or self.names[1],
+            winner=self.winner,
+            failure=self.failure,
+            black_score=black_score,
+            white_score=white_score,
+            turns=self._board.turns,
+            black_time=self._times[Color.BLACK],
+            white_time=self._times[Color.WHITE],
+            moves=format_moves(self._moves),
+            seed=self.seed,
+            size=self._board.size,
+            adjudicated=self._adjudicated,
         )
 
     @property
@@ -84,37 +175,151 @@ class BoardAdapter:
         return self._current_player.color
 
     def update(self, view: AbstractView) -> bool:
-        updated = False
+        if self._profiler is None:
+            return self._update(view)
+
+        with self._profiler.measure_update(self._board.turns, self._board.MAX_TURNS):
+            return self._update(view)
+
+    def _update(self, view: AbstractView) -> bool:
+        color = self._current_player.color
+        task = self._pondering.pop(color, None)
+        replies = task.stop() if task else None
+        move: T.Optional[T.Tuple[int, int]] = None
+
+        if self._has_moves(color):
+            clock_state = self._start_clock(color)
+            with self._failing_on_error(color):
+                move = self._pondered_move(replies, color)
+                if move is None:
+                    with self._timing(color):
+                        move = self._current_player_generic_play(
+                            self._board.get_clone(), view, clock_state
+                        )
+
+                self._play_move(move, color)
+
+        return self._end_turn(move, color)
+
+    # Steps of an update shared with AsyncBoardAdapter, only the way the move is asked differs
 
-        if self._has_moves(self._current_player.color):
-            try:
-                self._board.play(
-                    self._current_player_generic_play(self._board.get_clone(), view),
-                    self._current_player.color,
-                )
-            except Exception:
-                self._failure = self._current_player.color
-                raise
+    def _start_clock(self, color: Color) -> T.Optional["ClockState"]:
+        return self.clock.start(color) if self.clock else None
 
-            updated = True
+    @contextmanager
+    def _failing_on_error(self, color: Color) -> T.Iterator[None]:
+        try:
+            yield
+        except Exception:
+            self._failure = color
+            # A W/O also ends the game, even if the caller stops before asking finished
+            self.finished()
+            raise
 
-        self._current_player = self._players.get_player(self._current_player.color.opposite())
+    @contextmanager
+    def _timing(self, color: Color) -> T.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._times[color] += time.perf_counter() - start
+
+    def _play_move(self, move: T.Tuple[int, int], color: Color) -> None:
+        self._stop_clock(color)
+        self._board.play(move, color)
+        self._moves.append(move)
+
+    def _end_turn(self, move: T.Optional[T.Tuple[int, int]], color: Color) -> bool:
+        # Passes the turn to the opponent, move is None when color had to pass
+        updated = move is not None
+        if updated:
+            self._start_pondering(color)
+
+        self._last_move = move
+        self._current_player = self._players.get_player(color.opposite())
+
+        if updated and self._adjudicator is not None:
+            self._adjudicate(self._adjudicator, color.opposite())
 
         return updated
 
+    def _pondered_move(
+        self, replies: T.Optional[T.Mapping[T.Tuple[int, int], T.Tuple[int, int]]], color: Color
+    ) -> T.Optional[T.Tuple[int, int]]:
+        # Reply the player prepared while pondering to the move just made, if still legal
+        move = replies.get(self._last_move) if replies and self._last_move else None
+        return move if move is not None and move in self._board.valid_moves(color) else None
+
+    def _start_pondering(self, color: Color) -> None:
+        ponder = getattr(self._current_player, "ponder", None)
+        if self._ponder and callable(ponder):
+            # Think on the opponent's time, until it is this player's turn again
+            self._pondering[color] = PonderTask(
+                T.cast("PonderingPlayerProtocol", self._current_player), self._board.get_clone()
+            )
+
+    def _adjudicate(self, adjudicator: "Adjudicator", color: Color) -> None:
+        # Project
+        from ..models.proof_search import WIN, DRAW
+
+        # color may have to pass, the adjudicator handles it like any other position
+        outcome = adjudicator(self._board, color)
+        if outcome is None:
+            return
+
+        self._adjudicated = True
+        self._adjudicated_winner = (
+            None if outcome == DRAW else (color if outcome == WIN else color.opposite())
+        )
+
+    def _stop_clock(self, color: Color) -> None:
+        if self.clock is None:
+            return
+
+        self.clock.stop(color)
+        if self.clock.flagged(color):
+            # Handled like any other failure to play, the game is lost by W/O
+            raise TimeoutError(f"Tempo esgotado para o jogador {repr(color)}")
+
     def _has_moves(self, color: Color) -> bool:
         return len(self._board.valid_moves(color)) > 0
 
-    def _current_player_generic_play(self, board: Board, view: AbstractView) -> T.Tuple[int, int]:
-        args_list = list(signature(self._current_player.play).parameters.keys())
+    def _measure_play(self) -> T.ContextManager[None]:
+        if self._profiler is None:
+            return nullcontext()
+
+        return self._profiler.measure_play(
+            self._current_player, self._board.turns, self._board.MAX_TURNS
+        )
+
+    def _current_player_generic_play(
+        self, board: Board, view: AbstractView, clock: T.Optional["ClockState"] = None
+    ) -> T.Tuple[int, int]:
+        with self._measure_play():
+            return T.cast(
+                T.Tuple[int, int], self._call_play(self._current_player.play, board, view, clock)
+            )
+
+    @staticmethod
+    def _call_play(
+        play: T.Callable[..., T.Any],
+        board: Board,
+        view: T.Optional[AbstractView],
+        clock: T.Optional["ClockState"] = None,
+    ) -> T.Any:
+        parameters = signature(play).parameters
+        args_list = list(parameters.keys())
         if args_list[0] in ("self", "cls"):
             args_list.pop(0)
 
-        args = set(args_list) - {"kwargs"}
+        # Only players that ask for the clock by name get it
+        kwargs = {"clock": clock} if clock is not None and "clock" in parameters else {}
+
+        args = set(args_list) - {"kwargs", "clock"}
         if args == {"board"}:
-            return self._current_player.play(board)
+            return play(board, **kwargs)
         else:
-            return self._current_player.play(board, view=view)
+            return play(board, view=view, **kwargs)
 
 
 __all__ = ("BoardAdapter",)
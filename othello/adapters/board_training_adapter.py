@@ -1,8 +1,10 @@
 # Internal
 import typing as T
+from inspect import Parameter, signature
 
 # Project
 from ..enums import Color
+from ..models import Board
 from ..abstract import PlayerProtocol, TrainingPlayerProtocol
 from .board_adapter import BoardAdapter
 from ..misc.runtime_importer import import_player
@@ -11,26 +13,63 @@ if T.TYPE_CHECKING:
     # Internal
     from pkgutil import ModuleInfo
 
+    # Project
+    from ..misc.profiler import PlayerProfiler
+    from ..misc.clock import GameClock
+    from ..misc.result_sink import ResultSink
+    from ..models.replay_buffer import ReplayBuffer
+
 
 class BoardTrainingAdapter(BoardAdapter):
     def __init__(
         self,
         black: T.Union["ModuleInfo", TrainingPlayerProtocol],
         white: T.Union["ModuleInfo", PlayerProtocol],
+        profiler: T.Optional["PlayerProfiler"] = None,
+        ponder: bool = False,
+        sink: T.Optional["ResultSink"] = None,
+        names: T.Optional[T.Tuple[str, str]] = None,
+        seed: T.Optional[int] = None,
+        size: int = Board.SIZE,
+        replay_buffer: T.Optional["ReplayBuffer"] = None,
+        clock: T.Optional["GameClock"] = None,
     ) -> None:
+        if replay_buffer is not None and size != Board.SIZE:
+            raise ValueError("Memória de treino suporta apenas tabuleiros 8x8")
+
         training_player = (
             black
             if isinstance(black, TrainingPlayerProtocol)
             else import_player(black, TrainingPlayerProtocol)(Color.BLACK)
         )
 
-        super().__init__(training_player, white)
+        super().__init__(
+            training_player, white, profiler, ponder, sink, names, seed, size, clock=clock
+        )
 
         self.training_player = training_player
+        self.replay_buffer = replay_buffer
+
+    def _game_over(self) -> None:
+        super()._game_over()
 
-    def finished(self) -> bool:
-        is_finished = super().finished()
-        if is_finished:
+        if self.replay_buffer is None:
             self.training_player.game_over(self.winner, self._board)
+            return
 
-        return is_finished
+        # Every position of the game, from both sides, goes to the shared buffer, so the player
+        # doesn't need to keep its own history
+        self.replay_buffer.add_game(self._moves, self.winner)
+        game_over: T.Callable[..., None] = self.training_player.game_over
+        if self._accepts_buffer(game_over):
+            # Extra keyword, outside of TrainingPlayerProtocol
+            game_over(self.winner, self._board, replay_buffer=self.replay_buffer)
+        else:
+            self.training_player.game_over(self.winner, self._board)
+
+    @staticmethod
+    def _accepts_buffer(game_over: T.Callable[..., T.Any]) -> bool:
+        parameters = signature(game_over).parameters
+        return "replay_buffer" in parameters or any(
+            param.kind is Parameter.VAR_KEYWORD for param in parameters.values()
+        )
@@ -0,0 +1,37 @@
+# Internal
+import typing as T
+from threading import Event, Thread
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..models import Board
+    from ..abstract import PonderingPlayerProtocol
+
+# Type generics
+Replies_t = T.Mapping[T.Tuple[int, int], T.Tuple[int, int]]
+
+
+class PonderTask:
+    # How long to wait for a player that ignores the stop request before discarding its result
+    JOIN_TIMEOUT = 1.0
+
+    def __init__(self, player: "PonderingPlayerProtocol", board: "Board") -> None:
+        self._stop = Event()
+        self._result: T.Optional[Replies_t] = None
+        self._thread = Thread(target=self._run, args=(player, board), daemon=True)
+        self._thread.start()
+
+    def _run(self, player: "PonderingPlayerProtocol", board: "Board") -> None:
+        try:
+            self._result = player.ponder(board, self._stop)
+        except Exception:
+            # Pondering is best effort, a failure must not affect the game
+            self._result = None
+
+    def stop(self) -> T.Optional[Replies_t]:
+        self._stop.set()
+        self._thread.join(self.JOIN_TIMEOUT)
+        return None if self._thread.is_alive() else self._result
+
+
+__all__ = ("PonderTask",)
@@ -0,0 +1,256 @@
+# Internal
+import os
+import sys
+import asyncio
+import struct
+import typing as T
+import multiprocessing
+from threading import Lock, Thread, BoundedSemaphore
+from importlib import import_module
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import Connection, wait
+
+if sys.version_info >= (3, 8):
+    # Internal
+    from multiprocessing.shared_memory import SharedMemory
+
+# Project
+from ..enums import Color
+from ..models import Board, Position
+from ..models.codec import NO_MOVE, POSITION, decode, encode_into, decode_move, encode_move
+
+# Each slot holds an encoded position followed by the chosen move, padded to 32 bytes
+SLOT_SIZE = 32
+MOVE_OFFSET = POSITION.size
+# Control message exchanged through the pipes, the index of the slot that is ready
+SLOT_MESSAGE = struct.Struct("<H")
+# Sent instead of a slot index to make the worker exit. Closing the pipe isn't enough, forked
+# workers keep copies of the parent ends, so recv would never see the end of the pipe
+STOP = 0xFFFF
+
+PlayerFactory_t = T.Union[str, T.Callable[[Color], T.Any]]
+
+
+def _player_factory(player: PlayerFactory_t) -> T.Callable[[Color], T.Any]:
+    if not isinstance(player, str):
+        return player
+
+    # "module:Class", same format used for views
+    module, _, name = player.partition(":")
+    return T.cast(T.Callable[[Color], T.Any], getattr(import_module(module), name))
+
+
+def _worker_main(memory_name: str, player: PlayerFactory_t, conn: Connection) -> None:
+    memory = SharedMemory(memory_name)
+    buffer = T.cast(memoryview, memory.buf)
+    factory = _player_factory(player)
+    players = {color: factory(color) for color in Color.valid()}
+
+    try:
+        while True:
+            try:
+                message = conn.recv_bytes()
+            except (EOFError, OSError):
+                return
+
+            (slot,) = SLOT_MESSAGE.unpack(message)
+            if slot == STOP:
+                return
+
+            offset = slot * SLOT_SIZE
+            board, color = decode(buffer, offset)
+            try:
+                move = encode_move(players[T.cast(Color, color)].play(board))
+            except Exception:
+                move = NO_MOVE
+
+            buffer[offset + MOVE_OFFSET] = move
+            conn.send_bytes(message)
+    finally:
+        del buffer
+        memory.close()
+
+
+class _Worker:
+    def __init__(
+        self, player: PlayerFactory_t, slots: int, context: multiprocessing.context.BaseContext
+    ) -> None:
+        self.memory = SharedMemory(create=True, size=slots * SLOT_SIZE)
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(  # type: ignore
+            target=_worker_main, args=(self.memory.name, player, child_conn), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        self.free = deque(range(slots))
+        self.pending: T.Dict[int, "Future[T.Optional[Position]]"] = {}
+
+    def stop(self) -> None:
+        try:
+            self.conn.send_bytes(SLOT_MESSAGE.pack(STOP))
+        except OSError:
+            # Worker already gone
+            pass
+        self.conn.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+
+    @property
+    def buffer(self) -> memoryview:
+        # Only None once the memory is released
+        return T.cast(memoryview, self.memory.buf)
+
+    def release_memory(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedMemoryPool:
+    # Hosts players in worker processes. Positions and moves are written to a ring of slots in
+    # memory shared with each worker, only the slot index goes through the pipe, so a move costs
+    # a few microseconds of IPC instead of pickling a whole board
+    def __init__(
+        self,
+        player: PlayerFactory_t,
+        workers: T.Optional[int] = None,
+        slots: int = 64,
+        context: T.Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        if sys.version_info < (3, 8):
+            # The rest of the package still supports Python 3.7
+            raise RuntimeError("SharedMemoryPool requer Python 3.8 ou mais recente")
+
+        context = context or multiprocessing.get_context()
+        workers = workers or os.cpu_count() or 1
+        self._workers = [_Worker(player, slots, context) for _ in range(workers)]
+        self._lock = Lock()
+        self._available = BoundedSemaphore(len(self._workers) * slots)
+        self._closed = False
+
+        # Started after the workers, so no thread is running when they fork
+        self._reader = Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def request(self, board: Board, color: Color) -> "Future[T.Optional[Position]]":
+        future: "Future[T.Optional[Position]]" = Future()
+
+        # Waits when every slot is in use, bounding how many requests are in flight
+        self._available.acquire()
+        with self._lock:
+            if self._closed:
+                self._available.release()
+                raise RuntimeError("Pool de processos encerrado")
+
+            worker = max(self._workers, key=lambda item: len(item.free))
+            slot = worker.free.popleft()
+            worker.pending[slot] = future
+
+        try:
+            encode_into(worker.buffer, slot * SLOT_SIZE, board, color)
+            worker.conn.send_bytes(SLOT_MESSAGE.pack(slot))
+        except BaseException:
+            self._release(worker, slot)
+            raise
+
+        return future
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for worker in self._workers:
+            worker.stop()
+
+        self._reader.join(timeout=1)
+
+        for worker in self._workers:
+            for slot in list(worker.pending):
+                future = self._release(worker, slot)
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError("Pool de processos encerrado"))
+            worker.release_memory()
+
+    def __enter__(self) -> "SharedMemoryPool":
+        return self
+
+    def __exit__(self, *_: T.Any) -> None:
+        self.close()
+
+    def _release(self, worker: _Worker, slot: int) -> "Future[T.Optional[Position]]":
+        with self._lock:
+            future = worker.pending.pop(slot)
+            worker.free.append(slot)
+        self._available.release()
+        return future
+
+    def _read_loop(self) -> None:
+        by_conn = {worker.conn: worker for worker in self._workers}
+        while by_conn:
+            try:
+                ready = wait(list(by_conn))
+            except (OSError, ValueError):
+                # Pipes closed by close(), it fails the pending requests itself
+                return
+
+            for conn in ready:
+                worker = by_conn[T.cast(Connection, conn)]
+                try:
+                    (slot,) = SLOT_MESSAGE.unpack(worker.conn.recv_bytes())
+                except (EOFError, OSError, ValueError):
+                    # Worker exited or the pool was closed, fail whatever it still had
+                    del by_conn[T.cast(Connection, conn)]
+                    if self._closed:
+                        continue
+
+                    for slot in list(worker.pending):
+                        future = self._release(worker, slot)
+                        if future.set_running_or_notify_cancel():
+                            future.set_exception(ConnectionError("Processo do jogador encerrado"))
+                    continue
+
+                move = worker.buffer[slot * SLOT_SIZE + MOVE_OFFSET]
+                future = self._release(worker, slot)
+                # False when the requester already gave up on it, the slot is only reused once
+                # the worker is done with it
+                if future.set_running_or_notify_cancel():
+                    future.set_result(decode_move(move))
+
+
+class PooledPlayer:
+    # Player that forwards every move to a SharedMemoryPool, usable anywhere a player is expected
+    def __init__(
+        self, color: Color, pool: SharedMemoryPool, timeout: T.Optional[float] = None
+    ) -> None:
+        self.color = color
+        self.timeout = timeout
+        self._pool = pool
+
+    @staticmethod
+    def _checked(move: T.Optional[Position]) -> Position:
+        if move is None:
+            raise ValueError("Processo do jogador não retornou um movimento")
+        return move
+
+    def play(self, board: Board) -> Position:
+        future = self._pool.request(board, self.color)
+        try:
+            return self._checked(future.result(self.timeout))
+        finally:
+            # A late answer is discarded when the worker didn't answer in time
+            future.cancel()
+
+    async def play_async(self, board: Board) -> Position:
+        # Cancelling the wrapper, as wait_for does on timeout, also cancels the request
+        return self._checked(
+            await asyncio.wait_for(
+                asyncio.wrap_future(self._pool.request(board, self.color)), self.timeout
+            )
+        )
+
+
+__all__ = ("PooledPlayer", "SharedMemoryPool")
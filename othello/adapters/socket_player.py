@@ -0,0 +1,245 @@
+# Internal
+import os
+import socket
+import struct
+import asyncio
+import typing as T
+import itertools
+import socketserver
+from threading import Lock, Thread
+from concurrent.futures import Future
+
+# Project
+from ..enums import Color
+from ..models import Board, Position
+from ..models.codec import NO_MOVE, POSITION, decode, encode, decode_move, encode_move
+
+# Request: id, followed by the position as encoded by othello.models.codec
+REQUEST_ID = struct.Struct("<I")
+REQUEST_SIZE = REQUEST_ID.size + POSITION.size
+# Response: id, chosen move as encoded by othello.models.codec.encode_move
+RESPONSE = struct.Struct("<IB")
+
+# Address used by SocketPlayer when none is given
+ENGINE_ADDRESS_ENV = "OTHELLO_ENGINE"
+
+
+def parse_address(address: str) -> T.Tuple[int, T.Union[str, T.Tuple[str, int]]]:
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def encode_request(request_id: int, board: Board, color: Color) -> bytes:
+    return REQUEST_ID.pack(request_id) + encode(board, color)
+
+
+def decode_request(data: bytes) -> T.Tuple[int, Board, Color]:
+    (request_id,) = REQUEST_ID.unpack_from(data)
+    board, color = decode(data, REQUEST_ID.size)
+    if color is None:
+        raise ValueError("Requisição sem jogador da vez")
+
+    return request_id, board, color
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Conexão com a engine foi encerrada")
+        data += chunk
+    return bytes(data)
+
+
+class EngineConnection:
+    def __init__(self, address: str) -> None:
+        family, sock_address = parse_address(address)
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.connect(sock_address)
+        if family == socket.AF_INET:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._ids = itertools.count()
+        # Guards _pending, the socket has its own lock so a slow send doesn't hold back replies
+        self._lock = Lock()
+        self._send_lock = Lock()
+        self._pending: T.Dict[int, "Future[T.Optional[Position]]"] = {}
+        self._reader = Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def closed(self) -> bool:
+        return not self._reader.is_alive()
+
+    def request(self, board: Board, color: Color) -> "Future[T.Optional[Position]]":
+        future: "Future[T.Optional[Position]]" = Future()
+        with self._lock:
+            request_id = next(self._ids) & 0xFFFFFFFF
+            self._pending[request_id] = future
+        # However the request ends, it stops counting as pending, a reply to a cancelled request
+        # is discarded
+        future.add_done_callback(lambda _: self._discard(request_id))
+
+        try:
+            # Requests are pipelined, many can be in flight on the same connection
+            with self._send_lock:
+                self._sock.sendall(encode_request(request_id, board, color))
+        except OSError:
+            future.cancel()
+            raise
+
+        return future
+
+    def _discard(self, request_id: int) -> None:
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                request_id, square = RESPONSE.unpack(_recv_exactly(self._sock, RESPONSE.size))
+                with self._lock:
+                    future = self._pending.pop(request_id, None)
+                # False when the requester already gave up on it
+                if future is not None and future.set_running_or_notify_cancel():
+                    future.set_result(decode_move(square))
+        except (OSError, struct.error) as exc:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(ConnectionError(f"Falha na conexão com a engine: {exc}"))
+
+
+class EnginePool:
+    def __init__(self, address: str, size: int = 4) -> None:
+        self.size = size
+        self.address = address
+        self._lock = Lock()
+        self._connections: T.List[EngineConnection] = []
+
+    def connection(self) -> EngineConnection:
+        with self._lock:
+            self._connections = [conn for conn in self._connections if not conn.closed]
+            idle = min(self._connections, key=lambda conn: conn.pending, default=None)
+            if idle is None or (idle.pending and len(self._connections) < self.size):
+                idle = EngineConnection(self.address)
+                self._connections.append(idle)
+            return idle
+
+    def request(self, board: Board, color: Color) -> "Future[T.Optional[Position]]":
+        return self.connection().request(board, color)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+_pools: T.Dict[str, EnginePool] = {}
+_pools_lock = Lock()
+
+
+def engine_pool(address: str, size: int = 4) -> EnginePool:
+    # Every player connected to the same address shares one pool
+    with _pools_lock:
+        if address not in _pools:
+            _pools[address] = EnginePool(address, size)
+        return _pools[address]
+
+
+class SocketPlayer:
+    def __init__(
+        self,
+        color: Color,
+        address: T.Optional[str] = None,
+        pool_size: int = 4,
+        timeout: T.Optional[float] = None,
+    ) -> None:
+        address = address or os.environ.get(ENGINE_ADDRESS_ENV)
+        if not address:
+            raise ValueError(
+                f"Endereço da engine não informado, defina a variável {ENGINE_ADDRESS_ENV}"
+            )
+
+        self.color = color
+        self.timeout = timeout
+        self._pool = engine_pool(address, pool_size)
+
+    @staticmethod
+    def _checked(move: T.Optional[Position]) -> Position:
+        if move is None:
+            raise ValueError("Engine não retornou um movimento")
+        return move
+
+    def play(self, board: Board) -> Position:
+        future = self._pool.request(board, self.color)
+        try:
+            return self._checked(future.result(self.timeout))
+        finally:
+            # Frees the connection's slot when the engine didn't answer in time
+            future.cancel()
+
+    async def play_async(self, board: Board) -> Position:
+        # Cancelling the wrapper, as wait_for does on timeout, also cancels the request
+        return self._checked(
+            await asyncio.wait_for(
+                asyncio.wrap_future(self._pool.request(board, self.color)), self.timeout
+            )
+        )
+
+
+# Expose a python player as an engine that speaks the same protocol as SocketPlayer, call
+# serve_forever on the returned server to start answering requests
+def serve(address: str, player_cls: T.Callable[[Color], T.Any]) -> socketserver.BaseServer:
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            sock: socket.socket = self.request
+            # Each connection gets its own players, they are not required to be thread safe
+            players = {color: player_cls(color) for color in Color.valid()}
+            while True:
+                try:
+                    data = _recv_exactly(sock, REQUEST_SIZE)
+                except ConnectionError:
+                    return
+
+                request_id, board, color = decode_request(data)
+                try:
+                    square = encode_move(players[color].play(board))
+                except Exception:
+                    square = NO_MOVE
+
+                sock.sendall(RESPONSE.pack(request_id, square))
+
+    _, sock_address = parse_address(address)
+    if isinstance(sock_address, str):
+
+        class UnixServer(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        return UnixServer(sock_address, Handler)
+
+    class TCPServer(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+    return TCPServer(sock_address, Handler)
+
+
+__all__ = ("serve", "EnginePool", "SocketPlayer", "engine_pool", "EngineConnection")
@@ -0,0 +1,224 @@
+# Internal
+import os
+import sys
+import json
+import time
+import pickle
+import typing as T
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Internal
+    import resource
+except ImportError:  # pragma: no cover  # Windows
+    resource = None  # type: ignore
+
+# Project
+from ..enums import Color
+from .seeding import derive_seed
+from ..adapters import BoardAdapter
+from ..models.players.random_player import RandomPlayer
+from ..models.players.corner_player import CornerPlayer
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..abstract import PlayerProtocol
+
+
+class GameReport(T.NamedTuple):
+    game: int
+    winner: T.Optional[str]
+    moves: str
+    # Measured inside the worker, so the parent can tell play time from everything else
+    busy_s: float
+    pid: int
+    peak_rss_kib: T.Optional[int]
+
+
+def peak_rss_kib() -> T.Optional[int]:
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kibibytes everywhere else
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def play_game(game: int, seed: int, size: int) -> GameReport:
+    # Same players and seed for a given game number in any run, colors alternate between games
+    start = time.perf_counter()
+    players = (RandomPlayer, CornerPlayer) if game % 2 == 0 else (CornerPlayer, RandomPlayer)
+    black = T.cast("PlayerProtocol", players[0](Color.BLACK))
+    white = T.cast("PlayerProtocol", players[1](Color.WHITE))
+    adapter = BoardAdapter(black, white, seed=derive_seed(seed, game), size=size)
+    while not adapter.finished():
+        adapter.update(T.cast(T.Any, None))
+
+    result = adapter.result()
+    return GameReport(
+        game=game,
+        winner=result.winner.value if result.winner else None,
+        moves=result.moves,
+        busy_s=time.perf_counter() - start,
+        pid=os.getpid(),
+        peak_rss_kib=peak_rss_kib(),
+    )
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def worker_counts(max_workers: int) -> T.List[int]:
+    # 1, 2, 4 ... and max_workers itself when it isn't a power of two
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def run(workers: int, games: int, seed: int, size: int, pings: int = 200) -> T.Dict[str, T.Any]:
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as executor:
+        # Starts every process and imports the project in them, before anything is timed
+        for future in [executor.submit(_ping) for _ in range(workers * 2)]:
+            future.result()
+        startup = time.perf_counter() - start
+
+        # One task at a time, the round trip of an empty task is the cost of going through the
+        # pool's queues and pipes
+        ping_start = time.perf_counter()
+        for _ in range(pings):
+            executor.submit(_ping).result()
+        roundtrip = (time.perf_counter() - ping_start) / pings
+
+        play_start = time.perf_counter()
+        reports = list(
+            executor.map(play_game, range(games), [seed] * games, [size] * games, chunksize=1)
+        )
+        wall = time.perf_counter() - play_start
+
+    busy = sum(report.busy_s for report in reports)
+    peaks: T.Dict[int, int] = {}
+    for report in reports:
+        if report.peak_rss_kib is not None:
+            peaks[report.pid] = max(peaks.get(report.pid, 0), report.peak_rss_kib)
+
+    return {
+        "workers": workers,
+        "games": games,
+        "startup_s": startup,
+        "wall_s": wall,
+        "games_per_s": games / wall if wall else 0.0,
+        "busy_s": busy,
+        # Share of the workers' time not spent playing: IPC, pickling, scheduling and idle time
+        "overhead_pct": 100 * max(0.0, 1 - busy / (workers * wall)) if wall else 0.0,
+        "ipc_roundtrip_us": 1e6 * roundtrip,
+        "result_bytes_per_game": len(pickle.dumps(reports)) / games if games else 0.0,
+        "peak_rss_kib": max(peaks.values()) if peaks else None,
+        "peak_rss_kib_per_worker": sorted(peaks.values()),
+        "results": [(report.winner, report.moves) for report in reports],
+    }
+
+
+def main(argv: T.Optional[T.Sequence[str]] = None) -> int:
+    arg_parser = ArgumentParser(
+        prog="othello-bench",
+        description="Mede o ganho de jogar partidas em paralelo com 1, 2, 4 ... N processos",
+    )
+    arg_parser.add_argument(
+        "--partidas",
+        dest="games",
+        type=int,
+        default=64,
+        help="Partidas de RandomPlayer contra CornerPlayer em cada rodada",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--processos",
+        dest="processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maior número de processos medido",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--semente",
+        dest="seed",
+        type=int,
+        default=0,
+        help="Semente das partidas, as mesmas em todas as rodadas",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--tamanho",
+        dest="size",
+        type=int,
+        default=8,
+        choices=range(4, 17, 2),
+        help="Joga em um tabuleiro de N por N casas",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--saida",
+        dest="output_path",
+        help="Salva os resultados em JSON no arquivo, em vez da saída padrão",
+        metavar="ARQUIVO",
+    )
+    namespace = arg_parser.parse_args(argv)
+
+    runs: T.List[T.Dict[str, T.Any]] = []
+    print(
+        f"{'processos':>9} {'partidas/s':>11} {'eficiência':>11} {'overhead':>9} "
+        f"{'ipc (µs)':>9} {'rss (MiB)':>10}",
+        file=sys.stderr,
+    )
+    for workers in worker_counts(max(1, namespace.processes)):
+        stats = run(workers, namespace.games, namespace.seed, namespace.size)
+        base = runs[0]["games_per_s"] if runs else stats["games_per_s"]
+        stats["speedup"] = stats["games_per_s"] / base if base else 0.0
+        stats["efficiency"] = stats["speedup"] / workers
+        runs.append(stats)
+
+        rss = stats["peak_rss_kib"]
+        print(
+            f"{workers:>9} {stats['games_per_s']:>11.2f} {100 * stats['efficiency']:>10.1f}% "
+            f"{stats['overhead_pct']:>8.1f}% {stats['ipc_roundtrip_us']:>9.0f} "
+            f"{rss / 1024 if rss is not None else float('nan'):>10.1f}",
+            file=sys.stderr,
+        )
+
+    # Seeded games must come out the same no matter how many processes played them
+    consistent = all(stats["results"] == runs[0]["results"] for stats in runs)
+    for stats in runs:
+        del stats["results"]
+
+    report = {
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "games": namespace.games,
+        "seed": namespace.seed,
+        "size": namespace.size,
+        "consistent": consistent,
+        "runs": runs,
+    }
+    if namespace.output_path:
+        with open(namespace.output_path, "w", encoding="utf8") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if not consistent:
+        print("Resultados diferem entre as rodadas", file=sys.stderr)
+
+    return 0 if consistent else 1
+
+
+__all__ = ("main", "run", "play_game", "GameReport", "worker_counts")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# Internal
+import time
+import typing as T
+import threading
+from functools import wraps
+from contextlib import contextmanager
+
+# Project
+from ..models.board import Board, board_tables
+from ..models.bitboard import geometry
+
+# Board methods measured while counting, everything the engine and most players go through
+METHODS = (
+    "play",
+    "valid_moves",
+    "_find_bracket",
+    "_make_flips",
+    "get_clone",
+    "score",
+    "__getitem__",
+    "__setitem__",
+)
+
+# Memoized functions whose hits and misses are reported
+CACHES: T.Mapping[str, T.Any] = {"board_tables": board_tables, "geometry": geometry}
+
+FIELDS = ("method", "calls", "calls_per_game", "total_s", "self_s", "self_pct", "us_per_call")
+
+
+class CallStats:
+    __slots__ = ("calls", "total_s", "self_s")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        # total_s includes the Board methods called from inside, self_s doesn't
+        self.total_s = 0.0
+        self.self_s = 0.0
+
+
+class BoardCounters:
+    # Calls to and time spent in each Board method, kept per thread, so ponder threads don't race
+    # the main one, and merged when read
+    def __init__(self) -> None:
+        self.new_boards = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: T.List[T.Dict[str, CallStats]] = []
+        self._caches = {name: cache.cache_info() for name, cache in CACHES.items()}
+
+    def stats(self) -> T.Dict[str, CallStats]:
+        merged = {name: CallStats() for name in METHODS}
+        with self._lock:
+            for thread_stats in self._threads:
+                for name, item in thread_stats.items():
+                    total = merged[name]
+                    total.calls += item.calls
+                    total.total_s += item.total_s
+                    total.self_s += item.self_s
+        return merged
+
+    def cache_stats(self) -> T.Dict[str, T.Tuple[int, int]]:
+        # (hits, misses) since the counters were created
+        return {
+            name: (info.hits - self._caches[name].hits, info.misses - self._caches[name].misses)
+            for name, info in ((name, cache.cache_info()) for name, cache in CACHES.items())
+        }
+
+    def rows(self, games: T.Optional[int] = None) -> T.List[T.Dict[str, T.Any]]:
+        # Games default to the boards created from the initial position, clones aren't counted
+        games = games or self.new_boards or 1
+        stats = self.stats()
+        engine_s = sum(item.self_s for item in stats.values()) or 1.0
+        return [
+            {
+                "method": name,
+                "calls": item.calls,
+                "calls_per_game": item.calls / games,
+                "total_s": item.total_s,
+                "self_s": item.self_s,
+                "self_pct": 100 * item.self_s / engine_s,
+                "us_per_call": 1e6 * item.total_s / item.calls if item.calls else 0.0,
+            }
+            for name, item in sorted(stats.items(), key=lambda pair: -pair[1].self_s)
+        ]
+
+    def report(self, games: T.Optional[int] = None) -> str:
+        lines = [
+            f"{'método':<14} {'chamadas':>10} {'por partida':>12} {'total (s)':>10} "
+            f"{'próprio (s)':>12} {'%':>6} {'µs/chamada':>11}"
+        ]
+        for row in self.rows(games):
+            lines.append(
+                f"{row['method']:<14} {row['calls']:>10} {row['calls_per_game']:>12.1f} "
+                f"{row['total_s']:>10.3f} {row['self_s']:>12.3f} {row['self_pct']:>6.1f} "
+                f"{row['us_per_call']:>11.2f}"
+            )
+
+        for name, (hits, misses) in self.cache_stats().items():
+            lines.append(f"cache {name}: {hits} acertos, {misses} faltas")
+
+        return "\n".join(lines)
+
+    def _thread_state(self) -> T.Tuple[T.Dict[str, CallStats], T.List[float]]:
+        local = self._local
+        if not hasattr(local, "stats"):
+            local.stats = {name: CallStats() for name in METHODS}
+            # Time spent in nested Board calls, one entry per call being measured
+            local.stack = []
+            with self._lock:
+                self._threads.append(local.stats)
+        return local.stats, local.stack
+
+    def _wrap(self, name: str, method: T.Callable[..., T.Any]) -> T.Callable[..., T.Any]:
+        @wraps(method)
+        def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Any:
+            stats, stack = self._thread_state()
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = stack.pop()
+                item = stats[name]
+                item.calls += 1
+                item.total_s += elapsed
+                item.self_s += elapsed - nested
+                if stack:
+                    stack[-1] += elapsed
+
+        return wrapper
+
+    def _wrap_init(self, init: T.Callable[..., None]) -> T.Callable[..., None]:
+        @wraps(init)
+        def wrapper(board: Board, *args: T.Any, **kwargs: T.Any) -> None:
+            if (args[0] if args else kwargs.get("board")) is None:
+                with self._lock:
+                    self.new_boards += 1
+            init(board, *args, **kwargs)
+
+        return wrapper
+
+
+_active: T.Optional[BoardCounters] = None
+
+
+@contextmanager
+def count_board_calls(counters: T.Optional[BoardCounters] = None) -> T.Iterator[BoardCounters]:
+    # Swaps the Board methods for measured ones until the block exits, so there is no cost at all
+    # when not counting. Affects every Board in the process, including the players' ones
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("Contadores do tabuleiro já estão ativos")
+
+    counters = counters or BoardCounters()
+    originals = {name: Board.__dict__[name] for name in (*METHODS, "__init__")}
+    for name in METHODS:
+        setattr(Board, name, counters._wrap(name, originals[name]))
+    setattr(Board, "__init__", counters._wrap_init(originals["__init__"]))
+    _active = counters
+    try:
+        yield counters
+    finally:
+        for name, original in originals.items():
+            setattr(Board, name, original)
+        _active = None
+
+
+__all__ = ("FIELDS", "METHODS", "CallStats", "BoardCounters", "count_board_calls")
@@ -0,0 +1,126 @@
+# Internal
+import os
+import json
+import time
+import base64
+import typing as T
+
+# Project
+from ..models import GameResult
+
+
+class CheckpointState(T.NamedTuple):
+    config: T.Optional[T.Dict[str, T.Any]]
+    results: T.List[GameResult]
+    player_state: T.Optional[bytes]
+
+
+class Checkpoint:
+    # Append only JSON lines log of a run. Writes are flushed and fsync'ed in batches, a crash
+    # loses at most the records of the current batch, never the ones before it
+    def __init__(self, path: str, sync_every: int = 10, sync_interval: float = 5.0) -> None:
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._file: T.Optional[T.TextIO] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @staticmethod
+    def load(path: str) -> CheckpointState:
+        return Checkpoint._read(path)[0]
+
+    @staticmethod
+    def _read(path: str) -> T.Tuple[CheckpointState, int]:
+        config = None
+        results = []
+        player_state = None
+        valid_size = 0
+
+        try:
+            with open(path, "rb") as checkpoint_file:
+                for line in checkpoint_file:
+                    # Last line may be incomplete if the process died while writing it, even when
+                    # it parses, as the next record would be appended to it
+                    if not line.endswith(b"\n"):
+                        break
+
+                    try:
+                        record = json.loads(line.decode("utf8"))
+                    except ValueError:
+                        break
+
+                    valid_size += len(line)
+                    kind = record.pop("type")
+                    if kind == "config":
+                        config = record
+                    elif kind == "result":
+                        results.append(GameResult.from_record(record))
+                    elif kind == "player_state":
+                        player_state = base64.b64decode(record["state"])
+        except FileNotFoundError:
+            pass
+
+        return CheckpointState(config, results, player_state), valid_size
+
+    def resume(self, config: T.Dict[str, T.Any]) -> CheckpointState:
+        state, valid_size = self._read(self.path)
+        if state.config is not None and state.config != config:
+            raise RuntimeError(
+                f"Checkpoint {self.path} pertence a outra execução: {state.config} != {config}"
+            )
+
+        if os.path.exists(self.path) and os.path.getsize(self.path) != valid_size:
+            # Drop the incomplete record, so new ones are not appended to it
+            os.truncate(self.path, valid_size)
+
+        if state.config is None:
+            self._write({"type": "config", **config}, sync=True)
+
+        return state
+
+    def add_result(self, result: GameResult) -> None:
+        self._write({"type": "result", **result.to_record()})
+
+    def add_player_state(self, state: bytes) -> None:
+        self._write(
+            {"type": "player_state", "state": base64.b64encode(state).decode("ascii")}, sync=True
+        )
+
+    def sync(self) -> None:
+        if self._file is None or not self._unsynced:
+            return
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: T.Dict[str, T.Any], sync: bool = False) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf8")
+
+        self._file.write(json.dumps(record) + "\n")
+        self._unsynced += 1
+
+        if (
+            sync
+            or self._unsynced >= self.sync_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.sync()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *_: T.Any) -> None:
+        self.close()
+
+
+__all__ = ("Checkpoint", "CheckpointState")
@@ -0,0 +1,69 @@
+# Internal
+import time
+import typing as T
+
+# Project
+from ..enums import Color
+
+
+class ClockState(T.NamedTuple):
+    # What a player sees of the clock when asked to play, times in seconds
+    remaining: float
+    opponent: float
+    increment: float
+    # time.perf_counter() when this move's time started running
+    started: float
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def left(self) -> float:
+        return self.remaining - self.elapsed()
+
+
+class GameClock:
+    # Chess style clock with Fischer increments: each side starts with initial seconds, the time
+    # of its moves is subtracted and increment is added back after each move made in time
+    def __init__(self, initial: float, increment: float = 0.0) -> None:
+        if initial <= 0:
+            raise ValueError("Tempo inicial deve ser positivo")
+
+        self.initial = initial
+        self.increment = increment
+        self._remaining = {Color.BLACK: initial, Color.WHITE: initial}
+        self._started: T.Optional[float] = None
+
+    def remaining(self, color: Color) -> float:
+        return self._remaining[color]
+
+    def flagged(self, color: Color) -> bool:
+        return self._remaining[color] < 0
+
+    def start(self, color: Color) -> ClockState:
+        self._started = time.perf_counter()
+        return ClockState(
+            remaining=self._remaining[color],
+            opponent=self._remaining[color.opposite()],
+            increment=self.increment,
+            started=self._started,
+        )
+
+    def stop(self, color: Color) -> float:
+        if self._started is None:
+            raise RuntimeError("Relógio não foi iniciado")
+
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        self._remaining[color] -= elapsed
+        if self._remaining[color] >= 0:
+            self._remaining[color] += self.increment
+
+        return elapsed
+
+
+def format_clock(seconds: float) -> str:
+    sign, seconds = ("-" if seconds < 0 else ""), abs(seconds)
+    return f"{sign}{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+
+__all__ = ("GameClock", "ClockState", "format_clock")
@@ -0,0 +1,115 @@
+# Internal
+import sys
+import typing as T
+import subprocess
+from argparse import ArgumentParser
+
+# Modules that must not be loaded just by importing the command line entrypoint
+FORBIDDEN = (
+    "ctypes",
+    "tkinter",
+    "typing_extensions",
+    "othello.views.",
+    "othello.adapters.",
+    "othello.misc.error_dialog",
+    "othello.misc.runtime_importer",
+)
+
+
+class ImportTime(T.NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure(module: str = "othello.__main__") -> T.Sequence[ImportTime]:
+    result = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", f"import {module}"),
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+
+    return times
+
+
+def project_ms(times: T.Sequence[ImportTime], package: str = "othello") -> float:
+    # Only the time spent in the project's own modules, the standard library imported along the
+    # way varies too much between machines and runs to be budgeted
+    return (
+        sum(
+            entry.self_us
+            for entry in times
+            if entry.name == package or entry.name.startswith(f"{package}.")
+        )
+        / 1000
+    )
+
+
+def check(
+    module: str = "othello.__main__",
+    budget_ms: float = 25.0,
+    forbidden: T.Sequence[str] = FORBIDDEN,
+    runs: int = 5,
+) -> T.Sequence[str]:
+    # The best of several runs, a single one is easily slowed down by the rest of the machine
+    samples = [measure(module) for _ in range(max(1, runs))]
+    times = samples[0]
+    errors = [
+        f"{entry.name} não deveria ser importado por {module}"
+        for entry in times
+        if any(entry.name == name or entry.name.startswith(name) for name in forbidden)
+    ]
+
+    total_ms = min(project_ms(sample) for sample in samples)
+    if total_ms > budget_ms:
+        errors.append(
+            f"Módulos do projeto importados por {module} levaram {total_ms:.1f}ms "
+            f"(limite {budget_ms:.1f}ms)"
+        )
+
+    return errors
+
+
+def main() -> None:
+    arg_parser = ArgumentParser(description="Verifica o tempo de importação da aplicação")
+    arg_parser.add_argument(
+        "--modulo", dest="module", default="othello.__main__", help="Módulo a ser importado"
+    )
+    arg_parser.add_argument(
+        "--limite",
+        dest="budget_ms",
+        type=float,
+        default=25.0,
+        help="Tempo máximo gasto nos módulos do projeto, em milissegundos",
+    )
+    arg_parser.add_argument(
+        "--repeticoes",
+        dest="runs",
+        type=int,
+        default=5,
+        help="Medições feitas, vale a mais rápida",
+    )
+    namespace = arg_parser.parse_args()
+
+    errors = check(namespace.module, namespace.budget_ms, runs=namespace.runs)
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    sys.exit(1 if errors else 0)
+
+
+__all__ = ("check", "measure", "project_ms", "ImportTime")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# Internal
+import sys
+import typing as T
+from importlib import import_module
+
+
+# Build a module level __getattr__ (PEP 562) that only imports each attribute on first access,
+# attributes maps every public name to the relative submodule that defines it
+def lazy_attributes(package: str, attributes: T.Mapping[str, str]) -> T.Callable[[str], T.Any]:
+    def __getattr__(name: str) -> T.Any:
+        try:
+            submodule = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(import_module(submodule, package), name)
+        # Cache in the package namespace, so __getattr__ is only called once per name
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
+__all__ = ("lazy_attributes",)
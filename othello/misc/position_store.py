@@ -0,0 +1,223 @@
+# Internal
+import os
+import zlib
+import struct
+import typing as T
+from threading import Lock
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    # Internal
+    import fcntl
+except ImportError:  # pragma: no cover  # Windows
+    fcntl = None  # type: ignore
+
+# Record: own mask, opponent mask (side to move first), depth and value, followed by a crc32
+# of those fields. Records have a fixed size, so a torn write is always at the end of the file
+RECORD = struct.Struct("<QQBf")
+KEY = struct.Struct("<QQ")
+CHECKSUM = struct.Struct("<I")
+RECORD_SIZE = RECORD.size + CHECKSUM.size
+
+# Depth of exact results, e.g. endgames solved until the last move
+EXACT = 0xFF
+
+
+class Entry(T.NamedTuple):
+    value: float
+    depth: int
+
+    @property
+    def exact(self) -> bool:
+        return self.depth == EXACT
+
+
+def _pack(own: int, opp: int, entry: Entry) -> bytes:
+    record = RECORD.pack(own, opp, entry.depth, entry.value)
+    return record + CHECKSUM.pack(zlib.crc32(record))
+
+
+def _unpack(record: bytes) -> Entry:
+    _, _, depth, value = RECORD.unpack_from(record)
+    return Entry(value, depth)
+
+
+class PositionStore:
+    # Append only log of position values, with an in memory index of where the best record of
+    # each position is (bitcask style) and a LRU of recently used values in front of it. Many
+    # processes may read and write the same file, writes are appended under an advisory lock and
+    # readers pick up records written by others with refresh
+    def __init__(self, path: str, cache_size: int = 1 << 16, batch_size: int = 256) -> None:
+        self.path = path
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.hits = self.misses = 0
+
+        self._lock = Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._index: T.Dict[bytes, T.Tuple[int, int]] = {}  # key -> (offset, depth)
+        self._cache: "OrderedDict[bytes, Entry]" = OrderedDict()
+        self._pending: T.Dict[bytes, bytes] = {}
+        self._scanned = 0
+
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._index) + sum(key not in self._index for key in self._pending)
+
+    def __contains__(self, position: T.Tuple[int, int]) -> bool:
+        return self.get(*position) is not None
+
+    def get(self, own: int, opp: int, min_depth: int = 0) -> T.Optional[Entry]:
+        key = KEY.pack(own, opp)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            elif key in self._pending:
+                entry = _unpack(self._pending[key])
+            elif key in self._index:
+                entry = self._read(self._index[key][0])
+                if entry is not None:
+                    self._remember(key, entry)
+
+        if entry is None or entry.depth < min_depth:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, own: int, opp: int, value: float, depth: int = EXACT) -> None:
+        key = KEY.pack(own, opp)
+        entry = Entry(value, depth)
+        with self._lock:
+            # Deeper results replace shallower ones, never the other way around
+            known = self._index.get(key)
+            if key in self._pending:
+                known = (-1, _unpack(self._pending[key]).depth)
+            if known is not None and known[1] >= depth:
+                return
+
+            self._pending[key] = _pack(own, opp, entry)
+            self._remember(key, entry)
+            flush = len(self._pending) >= self.batch_size
+
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            with self._file_lock():
+                size = os.fstat(self._fd).st_size
+                if size % RECORD_SIZE:
+                    # Left by a writer that died mid write, appending after it would misalign
+                    # every following record
+                    os.ftruncate(self._fd, size - size % RECORD_SIZE)
+
+                self._scan()
+                offset = os.lseek(self._fd, 0, os.SEEK_END)
+                # A single write per batch, appended as a whole while the file is locked
+                os.write(self._fd, b"".join(pending.values()))
+
+            for key, record in pending.items():
+                depth = _unpack(record).depth
+                if key not in self._index or self._index[key][1] < depth:
+                    self._index[key] = (offset, depth)
+                offset += RECORD_SIZE
+            self._scanned = offset
+
+    def refresh(self) -> None:
+        # Indexes records appended since the last scan, by this or any other process
+        with self._lock:
+            self._scan()
+
+    def compact(self) -> None:
+        # Rewrites the log keeping only the best record of each position. Other processes keep
+        # reading the old file until they reopen the store, so only compact when none is using it
+        self.flush()
+        with self._lock, self._file_lock():
+            self._scan()
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as tmp_file:
+                index = {}
+                for offset, (key, (old_offset, depth)) in enumerate(sorted(self._index.items())):
+                    tmp_file.write(os.pread(self._fd, RECORD_SIZE, old_offset))
+                    index[key] = (offset * RECORD_SIZE, depth)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+
+            os.replace(tmp_path, self.path)
+            os.close(self._fd)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+            self._index = index
+            self._scanned = len(index) * RECORD_SIZE
+
+    def close(self) -> None:
+        self.flush()
+        os.close(self._fd)
+
+    def __enter__(self) -> "PositionStore":
+        return self
+
+    def __exit__(self, *_: T.Any) -> None:
+        self.close()
+
+    @contextmanager
+    def _file_lock(self) -> T.Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _remember(self, key: bytes, entry: Entry) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _read(self, offset: int) -> T.Optional[Entry]:
+        data = os.pread(self._fd, RECORD_SIZE, offset)
+        if len(data) < RECORD_SIZE:
+            return None
+
+        (checksum,) = CHECKSUM.unpack_from(data, RECORD.size)
+        if zlib.crc32(data[: RECORD.size]) != checksum:
+            return None
+
+        return _unpack(data)
+
+    def _scan(self) -> None:
+        size = os.fstat(self._fd).st_size
+        # Whole records only, one still being written is picked up by a later scan
+        end = self._scanned + (size - self._scanned) // RECORD_SIZE * RECORD_SIZE
+        offset = self._scanned
+        while offset < end:
+            chunk = os.pread(self._fd, min(end - offset, RECORD_SIZE * 4096), offset)
+            for start in range(0, len(chunk), RECORD_SIZE):
+                record = chunk[start : start + RECORD_SIZE]
+                (checksum,) = CHECKSUM.unpack_from(record, RECORD.size)
+                if zlib.crc32(record[: RECORD.size]) == checksum:
+                    key = record[: KEY.size]
+                    depth = _unpack(record).depth
+                    known = self._index.get(key)
+                    if known is None or known[1] < depth:
+                        self._index[key] = (offset + start, depth)
+                        # Values written by other processes may be better than the cached ones
+                        self._cache.pop(key, None)
+            offset += len(chunk)
+
+        self._scanned = end
+
+
+__all__ = ("EXACT", "Entry", "PositionStore")
@@ -0,0 +1,166 @@
+# Internal
+import os
+import sys
+import csv
+import json
+import time
+import typing as T
+import cProfile
+import tracemalloc
+from os import path
+from contextlib import contextmanager
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..abstract import PlayerProtocol
+
+# Name used for the time spent inside BoardAdapter.update, excluding the players
+ENGINE = "engine"
+
+FIELDS = (
+    "player",
+    "phase",
+    "calls",
+    "wall_s",
+    "cpu_s",
+    "allocated_blocks",
+    "peak_bytes",
+    "nodes",
+)
+
+
+def game_phase(turns: int, max_turns: int) -> str:
+    # Thirds of the game, 20 and 40 turns on a 8x8 board
+    third = turns * 3 // max_turns
+    return "opening" if third < 1 else ("midgame" if third < 2 else "endgame")
+
+
+def player_name(player: "PlayerProtocol") -> str:
+    color = getattr(player, "color", None)
+    return f"{type(player).__name__}({color.value})" if color else type(player).__name__
+
+
+class Stats:
+    __slots__ = FIELDS[2:]
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.allocated_blocks = 0
+        self.peak_bytes = 0
+        self.nodes = 0
+
+
+class PlayerProfiler:
+    def __init__(self, track_allocations: bool = True, cprofile_dir: T.Optional[str] = None):
+        self.cprofile_dir = cprofile_dir
+        self.track_allocations = track_allocations
+        self._stats: T.Dict[T.Tuple[str, str], Stats] = {}
+        self._profiles: T.Dict[str, cProfile.Profile] = {}
+        # Time spent by players inside the update currently being measured
+        self._nested_wall = 0.0
+        self._nested_cpu = 0.0
+
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stats(self, name: str, turns: int, max_turns: int) -> Stats:
+        key = (name, game_phase(turns, max_turns))
+        if key not in self._stats:
+            self._stats[key] = Stats()
+        return self._stats[key]
+
+    @contextmanager
+    def measure_update(self, turns: int, max_turns: int) -> T.Iterator[None]:
+        self._nested_wall = self._nested_cpu = 0.0
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stats = self.stats(ENGINE, turns, max_turns)
+            stats.calls += 1
+            stats.wall_s += time.perf_counter() - wall - self._nested_wall
+            stats.cpu_s += time.process_time() - cpu - self._nested_cpu
+
+    @contextmanager
+    def measure_play(
+        self, player: "PlayerProtocol", turns: int, max_turns: int
+    ) -> T.Iterator[None]:
+        name = player_name(player)
+        stats = self.stats(name, turns, max_turns)
+
+        profile = None
+        if self.cprofile_dir is not None:
+            profile = self._profiles.setdefault(name, cProfile.Profile())
+
+        if self.track_allocations:
+            start_memory, _ = tracemalloc.get_traced_memory()
+            # Python 3.9+, before it the peak covers the whole run
+            reset_peak = getattr(tracemalloc, "reset_peak", None)
+            if reset_peak is not None:
+                reset_peak()
+        start_blocks = sys.getallocatedblocks()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+
+            self._nested_wall += wall
+            self._nested_cpu += cpu
+
+            stats.calls += 1
+            stats.wall_s += wall
+            stats.cpu_s += cpu
+            stats.allocated_blocks += sys.getallocatedblocks() - start_blocks
+            if self.track_allocations:
+                _, peak = tracemalloc.get_traced_memory()
+                stats.peak_bytes = max(stats.peak_bytes, peak - start_memory)
+
+            # Players may report the size of their last search
+            nodes = getattr(player, "nodes_searched", None)
+            if isinstance(nodes, int):
+                stats.nodes += nodes
+
+    def rows(self) -> T.List[T.Dict[str, T.Any]]:
+        return [
+            {
+                "player": name,
+                "phase": phase,
+                **{key: getattr(stats, key) for key in Stats.__slots__},
+            }
+            for (name, phase), stats in sorted(self._stats.items())
+        ]
+
+    def export(self, file_path: str) -> None:
+        rows = self.rows()
+        with open(file_path, "w", encoding="utf8", newline="") as export_file:
+            if file_path.endswith(".csv"):
+                writer = csv.DictWriter(export_file, FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, export_file, indent=2)
+
+    def dump_profiles(self) -> T.Sequence[str]:
+        if self.cprofile_dir is None:
+            return ()
+
+        os.makedirs(self.cprofile_dir, exist_ok=True)
+        dumps = []
+        for name, profile in self._profiles.items():
+            dump_path = path.join(self.cprofile_dir, f"{name}.prof")
+            profile.dump_stats(dump_path)
+            dumps.append(dump_path)
+
+        return tuple(dumps)
+
+
+__all__ = ("ENGINE", "Stats", "game_phase", "PlayerProfiler")
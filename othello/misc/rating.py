@@ -0,0 +1,215 @@
+# Internal
+import math
+import typing as T
+from collections import defaultdict
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..models import GameResult
+
+# Normal quantile of a two-sided 95% confidence interval
+Z_95 = 1.959964
+
+
+def elo_to_score(elo: float) -> float:
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def score_to_elo(score: float) -> float:
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+class Estimate(T.NamedTuple):
+    elo: float
+    lower: float
+    upper: float
+
+    def __str__(self) -> str:
+        return f"{self.elo:+.1f} ({self.lower:+.1f}, {self.upper:+.1f})"
+
+
+class MatchStats:
+    # Head to head results of player against opponent, from the point of view of player
+    def __init__(self, player: str, opponent: str) -> None:
+        self.player = player
+        self.opponent = opponent
+        self.wins = self.draws = self.losses = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    @property
+    def variance(self) -> float:
+        # Per game variance of the trinomial win/draw/loss distribution
+        if not self.games:
+            return 0.0
+
+        score = self.score
+        return (
+            self.wins * (1 - score) ** 2
+            + self.draws * (0.5 - score) ** 2
+            + self.losses * score**2
+        ) / self.games
+
+    def update(self, result: "GameResult") -> None:
+        if {result.black, result.white} != {self.player, self.opponent}:
+            return
+
+        points = result.points(self.player)
+        if points == 1:
+            self.wins += 1
+        elif points == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def elo(self) -> Estimate:
+        margin = Z_95 * math.sqrt(self.variance / self.games) if self.games else 0.5
+        score = self.score
+        return Estimate(
+            score_to_elo(score), score_to_elo(score - margin), score_to_elo(score + margin)
+        )
+
+
+# Sequential probability ratio test between H0: elo = elo0 and H1: elo = elo1. Uses the
+# generalized (trinomial) log-likelihood ratio approximation, so it can be checked after every
+# game and the match stopped as soon as the ratio crosses one of the bounds
+class SPRT:
+    def __init__(
+        self,
+        stats: MatchStats,
+        elo0: float = 0.0,
+        elo1: float = 5.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+    ) -> None:
+        self.stats = stats
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    def llr(self) -> float:
+        variance = self.stats.variance
+        if variance <= 0:
+            return 0.0
+
+        score0, score1 = elo_to_score(self.elo0), elo_to_score(self.elo1)
+        return (
+            self.stats.games
+            * (score1 - score0)
+            * (2 * self.stats.score - score0 - score1)
+            / (2 * variance)
+        )
+
+    def decision(self) -> T.Optional[bool]:
+        # True when H1 is accepted, False when H0 is accepted, None while undecided
+        llr = self.llr()
+        if llr >= self.upper:
+            return True
+        if llr <= self.lower:
+            return False
+        return None
+
+
+class EloRatings:
+    # Incremental Elo, updated game by game from a stream of results
+    def __init__(self, k: float = 16.0, initial: float = 1500.0) -> None:
+        self.k = k
+        self.ratings: T.Dict[str, float] = defaultdict(lambda: initial)
+
+    def update(self, result: "GameResult") -> None:
+        black, white = self.ratings[result.black], self.ratings[result.white]
+        expected = elo_to_score(black - white)
+        delta = self.k * (result.points(result.black) - expected)
+        self.ratings[result.black] = black + delta
+        self.ratings[result.white] = white - delta
+
+
+# Bradley–Terry ratings over every result seen so far, draws count as half a win for each side.
+# Fitted with the MM algorithm, confidence intervals come from the Fisher information
+class BradleyTerry:
+    def __init__(self, anchor: float = 1500.0) -> None:
+        self.anchor = anchor
+        self._wins: T.Dict[str, float] = defaultdict(float)
+        self._games: T.Dict[T.Tuple[str, str], int] = defaultdict(int)
+        self._strength: T.Dict[str, float] = {}
+
+    def update(self, result: "GameResult") -> None:
+        self._wins[result.black] += result.points(result.black)
+        self._wins[result.white] += result.points(result.white)
+        pair = tuple(sorted((result.black, result.white)))
+        self._games[pair] += 1  # type: ignore
+
+    def _opponents(self, player: str) -> T.Iterator[T.Tuple[str, int]]:
+        for (a, b), games in self._games.items():
+            if a == player:
+                yield b, games
+            elif b == player:
+                yield a, games
+
+    def fit(self, iterations: int = 100, tolerance: float = 1e-9) -> None:
+        players = set(self._wins)
+        strength = {player: self._strength.get(player, 1.0) for player in players}
+
+        for _ in range(iterations):
+            updated = {}
+            for player in players:
+                denominator = sum(
+                    games / (strength[player] + strength[opponent])
+                    for opponent, games in self._opponents(player)
+                )
+                # A virtual draw against a reference player of strength 1 anchors the scale and
+                # keeps players that never won (or never lost) finite
+                updated[player] = (self._wins[player] + 0.5) / (
+                    denominator + 1 / (strength[player] + 1)
+                )
+
+            change = max(abs(updated[player] - strength[player]) for player in players)
+            strength = updated
+            if change < tolerance:
+                break
+
+        self._strength = strength
+
+    def ratings(self) -> T.Dict[str, Estimate]:
+        self.fit()
+
+        ratings = {}
+        scale = 400 / math.log(10)
+        for player, strength in self._strength.items():
+            information = sum(
+                games
+                * strength
+                * self._strength[opponent]
+                / (strength + self._strength[opponent]) ** 2
+                for opponent, games in self._opponents(player)
+            )
+            elo = self.anchor + scale * math.log(strength)
+            margin = Z_95 * scale / math.sqrt(information) if information else math.inf
+            ratings[player] = Estimate(elo, elo - margin, elo + margin)
+
+        return ratings
+
+
+def consume(
+    results: T.Iterable["GameResult"], *trackers: T.Any, sprt: T.Optional[SPRT] = None
+) -> T.Iterator["GameResult"]:
+    # Feed every tracker as results stream in, stops early once the SPRT reaches a decision
+    for result in results:
+        for tracker in trackers:
+            tracker.update(result)
+
+        yield result
+
+        if sprt is not None and sprt.decision() is not None:
+            return
+
+
+__all__ = ("SPRT", "consume", "Estimate", "MatchStats", "EloRatings", "BradleyTerry")
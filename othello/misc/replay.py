@@ -0,0 +1,235 @@
+# Internal
+import sys
+import json
+import time
+import typing as T
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import Future, Executor, ProcessPoolExecutor
+
+# Project
+from ..enums import Color
+from ..models import Board, GameResult
+from ..models.search import Evaluate_t, heuristic, score_moves
+from ..models.bitboard import Geometry, split, popcount, geometry
+from ..models.game_result import COLUMNS, parse_moves
+from .result_sink import read_results
+from .position_store import PositionStore
+
+# Evaluation and store of analysed positions used by the analysis, set once per process by
+# _init_worker
+_evaluate: Evaluate_t = heuristic
+_store: T.Optional[PositionStore] = None
+
+
+def _init_worker(weights_path: T.Optional[str], cache_path: T.Optional[str] = None) -> None:
+    global _store, _evaluate
+
+    # Each process opens its own handle, records written by the others are seen on refresh
+    _store = PositionStore(cache_path) if cache_path else None
+
+    if weights_path is None:
+        _evaluate = heuristic
+        return
+
+    # External
+    from ..models.patterns import PatternEvaluator
+
+    evaluator = PatternEvaluator.load(weights_path)
+
+    def evaluate(own: int, opp: int, geo: Geometry) -> float:
+        # Patterns only exist for the standard board
+        if geo.size != 8:
+            return heuristic(own, opp, geo)
+
+        return evaluator.evaluate_masks(own, opp, popcount(own | opp) - 4)
+
+    _evaluate = evaluate
+
+
+def square_name(move: T.Tuple[int, int]) -> str:
+    x, y = move
+    return f"{COLUMNS[y - 1]}{x}"
+
+
+def replay_game(game: GameResult, depth: int = 0) -> T.Dict[str, T.Any]:
+    # Replays the recorded moves, checking each one is legal and that the final score matches.
+    # When depth > 0 every position is also searched to find the best move and the size of the
+    # error made by the move actually played
+    report: T.Dict[str, T.Any] = {"black": game.black, "white": game.white, "error": None}
+    positions: T.List[T.Dict[str, T.Any]] = []
+    board = Board(None, game.size)
+    geo = geometry(game.size)
+    color = Color.BLACK
+
+    try:
+        moves = parse_moves(game.moves)
+    except ValueError as exc:
+        report["error"] = str(exc)
+        return report
+
+    for number, move in enumerate(moves):
+        valid_moves = board.valid_moves(color)
+        if not valid_moves:
+            # Passes are not recorded
+            color = color.opposite()
+            valid_moves = board.valid_moves(color)
+
+        if move not in valid_moves:
+            name = square_name(move)
+            report["error"] = f"Jogada {number + 1} ({name}) inválida para {repr(color)}"
+            return report
+
+        if depth > 0:
+            scores = score_moves(*split(board, color), depth, _evaluate, geo, _store)
+            best = max(scores, key=scores.__getitem__)
+            positions.append(
+                {
+                    "turn": board.turns,
+                    "color": color.value,
+                    "played": square_name(move),
+                    "best": square_name(best),
+                    "loss": scores[best] - scores[move],
+                }
+            )
+
+        board.play(move, color)
+        color = color.opposite()
+
+    white_score, black_score = board.score()
+    ended = not (board.valid_moves(Color.BLACK) or board.valid_moves(Color.WHITE))
+    if not (ended or game.failure or game.adjudicated):
+        report["error"] = "Partida termina antes do fim do jogo"
+    elif (black_score, white_score) != (game.black_score, game.white_score):
+        report["error"] = (
+            f"Placar {black_score}x{white_score} difere do registrado "
+            f"{game.black_score}x{game.white_score}"
+        )
+
+    if _store is not None:
+        # Once per game, so other processes pick up what this one found while it still matters
+        _store.flush()
+        _store.refresh()
+
+    if depth > 0:
+        report["positions"] = positions
+        for side in Color.valid():
+            losses = [pos["loss"] for pos in positions if pos["color"] == side.value]
+            report[f"{side.name.lower()}_loss"] = sum(losses) / len(losses) if losses else 0.0
+
+    return report
+
+
+def imap(
+    executor: T.Optional[Executor],
+    func: T.Callable[..., T.Any],
+    items: T.Iterable[T.Any],
+    *args: T.Any,
+    window: int = 64,
+) -> T.Iterator[T.Any]:
+    # Like Executor.map, but keeps at most window items in flight, instead of reading the whole
+    # input up front, so archives of any size can be streamed through the pool
+    if executor is None:
+        yield from (func(item, *args) for item in items)
+        return
+
+    pending: T.Deque["Future[T.Any]"] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def main(argv: T.Optional[T.Sequence[str]] = None) -> int:
+    arg_parser = ArgumentParser(
+        prog="othello-replay", description="Reproduz e verifica partidas gravadas"
+    )
+    arg_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Arquivos de resultados (.jsonl ou .csv), - lê JSON lines da entrada padrão",
+        metavar="ARQUIVO",
+    )
+    arg_parser.add_argument(
+        "--profundidade",
+        dest="depth",
+        type=int,
+        default=0,
+        help="Analisa cada posição com busca dessa profundidade, anotando a melhor jogada",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--pesos",
+        dest="weights_path",
+        help="Avalia as posições com os pesos de padrões salvos no arquivo (.npz)",
+        metavar="ARQUIVO",
+    )
+    arg_parser.add_argument(
+        "--processos",
+        dest="processes",
+        type=int,
+        default=0,
+        help="Distribui as partidas entre N processos",
+        metavar="N",
+    )
+    arg_parser.add_argument(
+        "--saida",
+        dest="output_path",
+        help="Salva o relatório de cada partida no arquivo, em vez da saída padrão",
+        metavar="ARQUIVO",
+    )
+    arg_parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        help=(
+            "Guarda os valores das posições analisadas no arquivo e reutiliza os já guardados, "
+            "sempre com os mesmos pesos"
+        ),
+        metavar="ARQUIVO",
+    )
+    namespace = arg_parser.parse_args(argv)
+
+    games = (result for path in namespace.paths for result in read_results(path))
+    init_args = (namespace.weights_path, namespace.cache_path)
+    executor = (
+        ProcessPoolExecutor(namespace.processes, initializer=_init_worker, initargs=init_args)
+        if namespace.processes > 1
+        else None
+    )
+    if executor is None:
+        _init_worker(*init_args)
+
+    output = open(namespace.output_path, "w", encoding="utf8") if namespace.output_path else None
+    total = invalid = 0
+    start = time.perf_counter()
+    reports = imap(executor, replay_game, games, namespace.depth, window=4 * namespace.processes)
+    try:
+        for total, report in enumerate(reports, 1):
+            if report["error"]:
+                invalid += 1
+            print(json.dumps(report), file=output or sys.stdout)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if _store is not None:
+            _store.close()
+        if output is not None:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{total} partidas, {invalid} inválidas, "
+        f"{total / elapsed if elapsed else 0.0:.1f} partidas/s",
+        file=sys.stderr,
+    )
+
+    return 1 if invalid else 0
+
+
+__all__ = ("imap", "main", "replay_game")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# Internal
+import sys
+import csv
+import json
+import typing as T
+from abc import ABCMeta, abstractmethod
+
+# Project
+from ..models import GameResult
+
+# Size of the write buffer, results reach the disk in blocks instead of one write per game
+BUFFER_SIZE = 1 << 16
+
+
+class ResultSink(metaclass=ABCMeta):
+    # Receives every finished game, results are streamed to their destination instead of being
+    # kept in memory, so the number of games played doesn't change the process footprint
+    @abstractmethod
+    def write(self, result: GameResult) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *_: T.Any) -> None:
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "a", encoding="utf8", buffering=BUFFER_SIZE)
+
+    def write(self, result: GameResult) -> None:
+        self._file.write(json.dumps(result.to_record()) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvSink(ResultSink):
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "a", encoding="utf8", newline="", buffering=BUFFER_SIZE)
+        self._writer = csv.DictWriter(self._file, GameResult._fields)
+
+        # Appending to an existing file must not repeat the header
+        if self._file.tell() == 0:
+            self._writer.writeheader()
+
+    def write(self, result: GameResult) -> None:
+        self._writer.writerow(result.to_record())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_sink(path: str) -> ResultSink:
+    return CsvSink(path) if path.endswith(".csv") else JsonlSink(path)
+
+
+# CSV stores everything as text, these fields are converted back when reading
+CSV_TYPES: T.Mapping[str, T.Callable[[str], T.Any]] = {
+    "winner": lambda value: value or None,
+    "failure": lambda value: value == "True",
+    "black_score": int,
+    "white_score": int,
+    "turns": int,
+    "black_time": float,
+    "white_time": float,
+    "seed": lambda value: int(value) if value else None,
+    "size": int,
+    "adjudicated": lambda value: value == "True",
+}
+
+
+def read_results(path: str) -> T.Iterator[GameResult]:
+    # Streams results written by one of the sinks above, "-" reads JSON lines from stdin
+    if path == "-":
+        for line in sys.stdin:
+            if line.strip():
+                yield GameResult.from_record(json.loads(line))
+        return
+
+    with open(path, encoding="utf8", newline="") as results_file:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(results_file):
+                yield GameResult.from_record(
+                    {
+                        key: CSV_TYPES[key](value) if key in CSV_TYPES else value
+                        for key, value in row.items()
+                    }
+                )
+        else:
+            for line in results_file:
+                if line.strip():
+                    yield GameResult.from_record(json.loads(line))
+
+
+__all__ = ("CsvSink", "JsonlSink", "ResultSink", "open_sink", "read_results")
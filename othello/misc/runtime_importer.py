@@ -1,9 +1,13 @@
 # Internal
+import os
 import sys
+import json
+import atexit
 import typing as T
 from os import path
-from inspect import isclass
-from pkgutil import ModuleInfo, walk_packages
+from inspect import isclass, isfunction
+from pkgutil import ModuleInfo, iter_modules
+from functools import lru_cache
 from importlib.util import module_from_spec
 from importlib.machinery import FileFinder, SourceFileLoader
 
@@ -13,6 +17,20 @@ from ..models.board import Board
 # Type generic
 K = T.TypeVar("K", bound=type)
 
+INDEX_VERSION = 1
+
+
+def _walk_players(paths: T.Iterable[str], prefix: str = "") -> T.Iterator[ModuleInfo]:
+    # Same modules walk_packages finds, but sub-packages are listed from their directories
+    # instead of being imported
+    for info in iter_modules(paths, prefix):
+        yield info
+        if info.ispkg:
+            package_path = T.cast(FileFinder, info.module_finder).path
+            yield from _walk_players(
+                [path.join(package_path, info.name.rpartition(".")[2])], f"{info.name}."
+            )
+
 
 def available_players(player_paths: T.Optional[T.Sequence[str]] = None) -> T.Sequence[ModuleInfo]:
     import othello
@@ -26,7 +44,7 @@ def available_players(player_paths: T.Optional[T.Sequence[str]] = None) -> T.Seq
 
     module_paths -= package_paths
     return (
-        *walk_packages(package_paths),
+        *_walk_players(sorted(package_paths)),
         *(
             ModuleInfo(
                 FileFinder(
@@ -36,7 +54,7 @@ def available_players(player_paths: T.Optional[T.Sequence[str]] = None) -> T.Seq
                 path.splitext(path.basename(module_path))[0],
                 False,
             )
-            for module_path in module_paths
+            for module_path in sorted(module_paths)
             if (
                 path.isfile(module_path)
                 and module_path.endswith(".py")
@@ -46,42 +64,153 @@ def available_players(player_paths: T.Optional[T.Sequence[str]] = None) -> T.Seq
     )
 
 
+# Persistent record of which class implements each protocol, per player file. Entries are
+# invalidated whenever the file modification time or size changes
+class PlayerIndex:
+    def __init__(self, index_path: T.Optional[str] = None) -> None:
+        if index_path is None:
+            cache_dir = os.environ.get("OTHELLO_CACHE_DIR") or path.join(
+                os.environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache"),
+                "othello",
+            )
+            index_path = path.join(cache_dir, "players.json")
+
+        self.path = index_path
+        self._dirty = False
+        self._entries: T.Optional[T.Dict[str, T.Dict[str, T.Any]]] = None
+
+    @property
+    def entries(self) -> T.Dict[str, T.Dict[str, T.Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf8") as index_file:
+                    data = json.load(index_file)
+                self._entries = data["entries"] if data.get("version") == INDEX_VERSION else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._entries = {}
+
+        return self._entries
+
+    @staticmethod
+    def stamp(file_path: str) -> T.Tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def lookup(self, file_path: str, protocol: type) -> T.Tuple[bool, T.Optional[str]]:
+        entry = self.entries.get(file_path)
+        if entry is None or tuple(entry["stamp"]) != self.stamp(file_path):
+            return False, None
+
+        players: T.Dict[str, T.Optional[str]] = entry["players"]
+        if protocol.__qualname__ not in players:
+            return False, None
+
+        return True, players[protocol.__qualname__]
+
+    def store(self, file_path: str, protocol: type, class_name: T.Optional[str]) -> None:
+        stamp = list(self.stamp(file_path))
+        entry = self.entries.get(file_path)
+        if entry is None or entry["stamp"] != stamp:
+            entry = self.entries[file_path] = {"stamp": stamp, "players": {}}
+
+        entry["players"][protocol.__qualname__] = class_name
+
+        if not self._dirty:
+            # Batch every change made during this run into a single write
+            self._dirty = True
+            atexit.register(self.flush)
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+
+        self._dirty = False
+        try:
+            os.makedirs(path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf8") as index_file:
+                json.dump({"version": INDEX_VERSION, "entries": self.entries}, index_file)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # The index is only an optimization, a read-only cache directory is not an error
+            pass
+
+
+player_index = PlayerIndex()
+
+# (file path, stamp, protocol) -> player class
+_resolved: T.Dict[T.Tuple[str, T.Tuple[int, int], type], type] = {}
+
+
+@lru_cache(maxsize=None)
+def _protocol_methods(protocol: type) -> T.FrozenSet[str]:
+    return frozenset(
+        name
+        for base in protocol.__mro__
+        if getattr(base, "_is_protocol", False)
+        for name, member in vars(base).items()
+        if name[0] != "_" and isfunction(member)
+    )
+
+
+def implements(cls: type, protocol: type) -> bool:
+    # Structural check equivalent to issubclass on a runtime Protocol, without its overhead
+    return all(callable(getattr(cls, name, None)) for name in _protocol_methods(protocol))
+
+
 def import_player(player_importer: ModuleInfo, protocol: K) -> K:
     loader, module_name, is_package = player_importer
+    location = path.join(loader.path, module_name)
 
-    if is_package:
+    if is_package and loader.path not in sys.path:
         sys.path.append(loader.path)
 
     module_spec = loader.find_spec(module_name)
-    if module_spec is None:
+    if module_spec is None or module_spec.origin is None:
         raise ImportError(
-            f"Falha ao importar {'pacote' if is_package else 'modulo'} em "
-            f"{path.join(loader.path, module_name)}"
+            f"Falha ao importar {'pacote' if is_package else 'modulo'} em {location}"
         )
 
-    module = module_from_spec(module_spec)
-    module_spec.loader.exec_module(module)
-
-    symbols = tuple(symbol for symbol in dir(module) if symbol[0] != "_")
-    module_all = getattr(module, "__all__", None)
-    if module_all:
-        symbols = tuple(symbol for symbol in symbols if symbol in module_all)
+    file_path = path.abspath(module_spec.origin)
+    stamp = PlayerIndex.stamp(file_path)
+    resolved = _resolved.get((file_path, stamp, protocol))
+    if resolved is not None:
+        return T.cast(K, resolved)
 
-    objects = tuple(getattr(module, symbol) for symbol in symbols)
+    indexed, class_name = player_index.lookup(file_path, protocol)
+    if indexed and class_name is None:
+        raise ImportError(
+            f"Nenhuma classe que implemente {protocol.__qualname__} foi encontrada em {location}"
+        )
 
-    try:
-        player_cls: K = next(
-            cls
-            for cls in objects
-            if isclass(cls) and issubclass(cls, protocol) and cls is not Board
+    module = module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore
+
+    player_cls = getattr(module, class_name, None) if class_name else None
+    if not (isclass(player_cls) and implements(player_cls, protocol)):
+        symbols = tuple(symbol for symbol in dir(module) if symbol[0] != "_")
+        module_all = getattr(module, "__all__", None)
+        if module_all:
+            symbols = tuple(symbol for symbol in symbols if symbol in module_all)
+
+        class_name, player_cls = next(
+            (
+                (symbol, cls)
+                for symbol, cls in ((symbol, getattr(module, symbol)) for symbol in symbols)
+                if isclass(cls) and cls is not Board and implements(cls, protocol)
+            ),
+            (None, None),
         )
-    except StopIteration:
+
+        player_index.store(file_path, protocol, class_name)
+
+    if player_cls is None:
         raise ImportError(
-            f"Nenhuma classe que implemente {protocol.__qualname__} foi "
-            f"encontrada em {path.join(loader.path, module_name)}"
-        ) from None
+            f"Nenhuma classe que implemente {protocol.__qualname__} foi encontrada em {location}"
+        )
 
-    return player_cls
+    _resolved[file_path, stamp, protocol] = player_cls
+    return T.cast(K, player_cls)
 
 
-__all__ = ("import_player", "available_players")
+__all__ = ("implements", "PlayerIndex", "import_player", "available_players")
@@ -0,0 +1,28 @@
+# Internal
+import typing as T
+from hashlib import blake2b
+
+# Seeds are kept within 63 bits, so they survive JSON, CSV and signed 64 bit storage
+SEED_MASK = (1 << 63) - 1
+
+
+def derive_seed(master: int, *path: int) -> int:
+    # Stable across processes and python versions (unlike hash), so game N of a run gets the
+    # same seed no matter which worker plays it or in which order the games are scheduled
+    digest = blake2b(
+        b":".join(str(value).encode("ascii") for value in (master, *path)), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little") & SEED_MASK
+
+
+def seed_player(player: T.Any, seed: int) -> bool:
+    # Players opt in by defining seed(self, seed), others are left untouched
+    seed_method = getattr(player, "seed", None)
+    if not callable(seed_method):
+        return False
+
+    seed_method(seed)
+    return True
+
+
+__all__ = ("derive_seed", "seed_player")
@@ -0,0 +1,22 @@
+# Internal
+import typing as T
+from time import monotonic
+
+
+class Throttle:
+    def __init__(self, rate: float, clock: T.Callable[[], float] = monotonic) -> None:
+        # A rate of zero (or less) disables throttling
+        self._clock = clock
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._last: T.Optional[float] = None
+
+    def ready(self) -> bool:
+        now = self._clock()
+        if self._last is not None and now - self._last < self._interval:
+            return False
+
+        self._last = now
+        return True
+
+
+__all__ = ("Throttle",)
@@ -0,0 +1,105 @@
+# Internal
+import time
+import typing as T
+
+# Project
+from .clock import ClockState
+
+
+class Budget(T.NamedTuple):
+    # Seconds a move should take (soft) and must never exceed (hard)
+    soft: float
+    hard: float
+
+
+class TimeManager:
+    # Splits the time left on the clock among the moves still to be played. Each side plays about
+    # half of the empty squares, the increment of every one of those moves is also available
+    def __init__(
+        self,
+        safety: float = 0.05,
+        min_budget: float = 0.005,
+        max_share: float = 0.25,
+        hard_factor: float = 4.0,
+    ) -> None:
+        # Fraction of the remaining time always kept in reserve
+        self.safety = safety
+        self.min_budget = min_budget
+        # Largest fraction of the usable time a single move may take, even at its hard limit
+        self.max_share = max_share
+        self.hard_factor = hard_factor
+
+    def moves_left(self, empties: int) -> float:
+        return max(1.0, (empties + 1) / 2)
+
+    def allocate(self, clock: ClockState, empties: int) -> Budget:
+        usable = max(0.0, clock.remaining * (1 - self.safety))
+        cap = max(self.min_budget, usable * self.max_share)
+        # Most of the increment comes back right after the move, so it can be spent on it
+        soft = usable / self.moves_left(empties) + 0.8 * clock.increment
+        soft = min(max(soft, self.min_budget), cap)
+        return Budget(soft, min(max(soft * self.hard_factor, soft), cap))
+
+    def start(self, clock: ClockState, empties: int) -> "MoveTimer":
+        return MoveTimer(self.allocate(clock, empties), clock.started)
+
+
+class MoveTimer:
+    # Decides, between iterations of an iterative deepening search, whether another one fits in
+    # the budget. The next iteration is predicted to take the last one times the branching factor
+    # seen so far, and a best move that keeps changing earns more time than a stable one
+    def __init__(self, budget: Budget, started: T.Optional[float] = None) -> None:
+        self.budget = budget
+        self.started = time.perf_counter() if started is None else started
+        self.iterations = 0
+        # Consecutive iterations that kept the same best move
+        self.stable = 0
+        self.branching = 0.0
+        self._best: T.Any = None
+        self._last_end = time.perf_counter()
+        self._last_duration = 0.0
+        self._last_nodes: T.Optional[int] = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def expired(self) -> bool:
+        # Checked inside a search, it must stop right away
+        return self.elapsed() >= self.budget.hard
+
+    def iteration_done(self, best: T.Any, nodes: T.Optional[int] = None) -> None:
+        now = time.perf_counter()
+        duration = now - self._last_end if self.iterations else now - self.started
+        self._last_end = now
+
+        # Node counts give a steadier estimate than times, when the search reports them
+        if nodes and self._last_nodes:
+            self.branching = nodes / self._last_nodes
+        elif self.iterations and self._last_duration > 0:
+            self.branching = duration / self._last_duration
+        self._last_nodes = nodes
+        self._last_duration = duration
+
+        self.stable = self.stable + 1 if self.iterations and best == self._best else 0
+        self._best = best
+        self.iterations += 1
+
+    def target(self) -> float:
+        # Up to 1.5x the soft budget while the best move changes, down to half once it settles
+        if self.iterations > 1 and not self.stable:
+            factor = 1.5
+        else:
+            factor = max(0.5, 1 - 0.1 * self.stable)
+        return min(self.budget.soft * factor, self.budget.hard)
+
+    def should_continue(self) -> bool:
+        elapsed = self.elapsed()
+        if elapsed >= self.target():
+            return False
+
+        # Without an estimate yet, assume a modest growth of the search
+        predicted = self._last_duration * (self.branching or 4.0)
+        return elapsed + predicted <= self.budget.hard
+
+
+__all__ = ("Budget", "MoveTimer", "TimeManager")
@@ -1,3 +1,4 @@
 # Project
 from .board import Board
 from .position import Position
+from .game_result import GameResult
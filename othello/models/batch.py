@@ -0,0 +1,116 @@
+# Internal
+import typing as T
+from itertools import chain
+from concurrent.futures import Executor
+
+# Project
+from ..enums import Color
+from .board import Board
+from .bitboard import split, geometry, positions, flips_mask, moves_mask
+from .position import Position
+
+# Positions per task when an executor is given, large enough that pickling the masks and the
+# task overhead stay small compared to the work
+CHUNK_SIZE = 4096
+
+# Flips of a move that isn't legal in its position
+ILLEGAL = -1
+
+
+def _legal_chunk(items: T.Sequence[T.Tuple[int, int, int]]) -> T.List[int]:
+    return [moves_mask(own, opp, geometry(size)) for own, opp, size in items]
+
+
+def _flips_chunk(items: T.Sequence[T.Tuple[int, int, int, int]]) -> T.List[int]:
+    ret = []
+    for own, opp, move, size in items:
+        geo = geometry(size)
+        ret.append(
+            flips_mask(own, opp, move, geo) if moves_mask(own, opp, geo) & move else ILLEGAL
+        )
+    return ret
+
+
+def _run(
+    func: T.Callable[[T.Sequence[T.Any]], T.List[int]],
+    items: T.Sequence[T.Any],
+    executor: T.Optional[Executor],
+    chunk_size: int,
+) -> T.List[int]:
+    if executor is None or len(items) <= chunk_size:
+        return func(items)
+
+    chunks = (items[start : start + chunk_size] for start in range(0, len(items), chunk_size))
+    return list(chain.from_iterable(executor.map(func, chunks)))
+
+
+def _colors(
+    boards: T.Sequence[Board], colors: T.Union[Color, str, T.Iterable[T.Union[Color, str]]]
+) -> T.List[Color]:
+    if isinstance(colors, (str, Color)):
+        return [Color(colors)] * len(boards)
+
+    ret = [Color(color) for color in colors]
+    if len(ret) != len(boards):
+        raise ValueError("Quantidade de cores difere da de tabuleiros")
+    return ret
+
+
+def _masks(boards: T.Sequence[Board], colors: T.Sequence[Color]) -> T.List[T.Tuple[int, int, int]]:
+    return [(*split(board, color), board.size) for board, color in zip(boards, colors)]
+
+
+def legal_moves_many(
+    boards: T.Sequence[Board],
+    colors: T.Union[Color, str, T.Iterable[T.Union[Color, str]]],
+    executor: T.Optional[Executor] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> T.List[T.Tuple[Position, ...]]:
+    # Same as calling Board.valid_moves for each board, but each move is listed once. colors is
+    # either one color for every board or one per board. With an executor, large inputs are split
+    # in chunks of masks, so boards are never pickled
+    masks = _masks(boards, _colors(boards, colors))
+    return [
+        positions(moves, geometry(size))
+        for moves, (_, _, size) in zip(_run(_legal_chunk, masks, executor, chunk_size), masks)
+    ]
+
+
+def apply_many(
+    boards: T.Sequence[Board],
+    moves: T.Iterable[T.Tuple[int, int]],
+    colors: T.Union[Color, str, T.Iterable[T.Union[Color, str]]],
+    executor: T.Optional[Executor] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> T.List[T.Optional[Board]]:
+    # Plays each move on a copy of its board, the boards given are left untouched. Illegal moves,
+    # off the board ones included, give None instead of raising, so a whole log can be validated
+    # in one call
+    color_list = _colors(boards, colors)
+    move_list = list(moves)
+    if len(move_list) != len(boards):
+        raise ValueError("Quantidade de jogadas difere da de tabuleiros")
+
+    # A square outside the board has no bit, an empty move mask is never legal
+    items = [
+        (own, opp, geometry(size).bits.get(Position(*move), 0), size)
+        for (own, opp, size), move in zip(_masks(boards, color_list), move_list)
+    ]
+
+    ret: T.List[T.Optional[Board]] = []
+    flips_list = _run(_flips_chunk, items, executor, chunk_size)
+    for board, color, (_, _, move, size), flips in zip(boards, color_list, items, flips_list):
+        if flips == ILLEGAL:
+            ret.append(None)
+            continue
+
+        clone = board.get_clone()
+        for square in positions(flips | move, geometry(size)):
+            clone[square] = color
+        clone._turns += 1
+        ret.append(clone)
+
+    return ret
+
+
+__all__ = ("ILLEGAL", "CHUNK_SIZE", "apply_many", "legal_moves_many")
@@ -0,0 +1,154 @@
+# Internal
+import typing as T
+from functools import lru_cache
+
+# Project
+from ..enums import Color
+from .position import Position
+
+if T.TYPE_CHECKING:
+    # Project
+    from .board import Board
+
+
+class Geometry(T.NamedTuple):
+    size: int
+    full: int
+    squares: T.Tuple[Position, ...]
+    bits: T.Mapping[Position, int]
+    # Direction (dx, dy) -> (bit shift, mask applied after shifting to drop wrapped squares)
+    shifts: T.Mapping[T.Tuple[int, int], T.Tuple[int, int]]
+    corners: int
+
+
+@lru_cache(maxsize=None)
+def geometry(size: int) -> Geometry:
+    # Square (x, y) is stored at bit (x - 1) * size + (y - 1), python integers grow as needed, so
+    # the same functions work for boards larger than 8x8
+    full = (1 << size * size) - 1
+    squares = tuple(Position(x, y) for x in range(1, size + 1) for y in range(1, size + 1))
+    bits = {pos: 1 << idx for idx, pos in enumerate(squares)}
+    not_first_column = sum(bit for (_, y), bit in bits.items() if y != 1)
+    not_last_column = sum(bit for (_, y), bit in bits.items() if y != size)
+
+    return Geometry(
+        size=size,
+        full=full,
+        squares=squares,
+        bits=bits,
+        shifts={
+            (dx, dy): (
+                dx * size + dy,
+                full if dy == 0 else (not_first_column if dy > 0 else not_last_column),
+            )
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            if dx or dy
+        },
+        corners=sum(bits[Position(x, y)] for x in (1, size) for y in (1, size)),
+    )
+
+
+# Tables of the standard 8x8 board, used when no geometry is given
+STANDARD = geometry(8)
+FULL = STANDARD.full
+SQUARES = STANDARD.squares
+BITS = STANDARD.bits
+SHIFTS = STANDARD.shifts
+
+NOT_FIRST_COLUMN = sum(bit for (_, y), bit in BITS.items() if y != 1)
+NOT_LAST_COLUMN = sum(bit for (_, y), bit in BITS.items() if y != 8)
+
+
+def shift(mask: int, direction: T.Tuple[int, int], geo: Geometry = STANDARD) -> int:
+    offset, wrap = geo.shifts[direction]
+    return ((mask << offset if offset > 0 else mask >> -offset) & wrap) & geo.full
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def neighbours(mask: int, geo: Geometry = STANDARD) -> int:
+    ret = 0
+    for direction in geo.shifts:
+        ret |= shift(mask, direction, geo)
+    return ret
+
+
+def from_board(board: "Board") -> T.Tuple[int, int]:
+    black = white = 0
+    for pos, bit in geometry(board.size).bits.items():
+        color = board[pos]
+        if color is Color.BLACK:
+            black |= bit
+        elif color is Color.WHITE:
+            white |= bit
+
+    return black, white
+
+
+def split(board: "Board", color: T.Union[Color, str]) -> T.Tuple[int, int]:
+    black, white = from_board(board)
+    return (black, white) if Color(color) is Color.BLACK else (white, black)
+
+
+def standard_split(board: "Board", color: T.Union[Color, str]) -> T.Tuple[int, int]:
+    # For tables that only exist for the 8x8 board, like features and patterns
+    if board.size != STANDARD.size:
+        raise ValueError(f"Suportado apenas em tabuleiros {STANDARD.size}x{STANDARD.size}")
+
+    return split(board, color)
+
+
+def moves_mask(own: int, opp: int, geo: Geometry = STANDARD) -> int:
+    empty = ~(own | opp) & geo.full
+    ret = 0
+    for direction in geo.shifts:
+        candidates = shift(own, direction, geo) & opp
+        while candidates:
+            candidates = shift(candidates, direction, geo)
+            ret |= candidates & empty
+            candidates &= opp
+    return ret
+
+
+def flips_mask(own: int, opp: int, move: int, geo: Geometry = STANDARD) -> int:
+    ret = 0
+    for direction in geo.shifts:
+        line = 0
+        square = shift(move, direction, geo)
+        while square & opp:
+            line |= square
+            square = shift(square, direction, geo)
+        if square & own:
+            ret |= line
+    return ret
+
+
+def positions(mask: int, geo: Geometry = STANDARD) -> T.Tuple[Position, ...]:
+    ret = []
+    while mask:
+        low = mask & -mask
+        ret.append(geo.squares[low.bit_length() - 1])
+        mask ^= low
+    return tuple(ret)
+
+
+__all__ = (
+    "BITS",
+    "STANDARD",
+    "Geometry",
+    "geometry",
+    "FULL",
+    "SQUARES",
+    "split",
+    "standard_split",
+    "shift",
+    "popcount",
+    "positions",
+    "from_board",
+    "neighbours",
+    "flips_mask",
+    "moves_mask",
+)
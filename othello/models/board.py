@@ -1,5 +1,6 @@
 # Internal
 import typing as T
+from functools import lru_cache
 from itertools import product
 from collections import Counter, defaultdict
 
@@ -16,16 +17,46 @@ def board_default() -> Color:
     return Color.OUTER
 
 
+class BoardTables(T.NamedTuple):
+    size: int
+    positions: T.Tuple[Position, ...]
+    corners: T.Tuple[Position, ...]
+    # Squared distance from each square to its nearest corner
+    corner_distance: T.Mapping[Position, int]
+    max_turns: int
+
+
+@lru_cache(maxsize=None)
+def board_tables(size: int) -> BoardTables:
+    # Computed once per board size, every board of the same size shares them
+    if size < 4 or size % 2:
+        raise ValueError(f"Tamanho de tabuleiro inválido: {size}")
+
+    positions = tuple(Position(*pos) for pos in product(range(1, size + 1), repeat=2))
+    corners = tuple(Position(x, y) for x in (1, size) for y in (1, size))
+    return BoardTables(
+        size=size,
+        positions=positions,
+        corners=corners,
+        corner_distance={
+            pos: min((pos.x - x) ** 2 + (pos.y - y) ** 2 for x, y in corners) for pos in positions
+        },
+        # Every empty square can be played at most once
+        max_turns=size * size - 4,
+    )
+
+
 class Board:
     # Maintain compatibility with old version
     EMPTY, BLACK, WHITE, OUTER = Color  # type: ignore  # mypy issue #2305
 
-    CORNERS = (Position(1, 1), Position(1, 8), Position(8, 1), Position(8, 8))
+    # Tables of the standard 8x8 board, instances of other sizes override them
+    SIZE = 8
+    CORNERS = board_tables(SIZE).corners
+    CORNER_DISTANCE = board_tables(SIZE).corner_distance
 
     # List of valid positions
-    POSITIONS: T.Tuple[Position, ...] = tuple(
-        Position(*pos) for pos in product(range(1, 9), repeat=2)
-    )
+    POSITIONS: T.Tuple[Position, ...] = board_tables(SIZE).positions
 
     # Basic directions
     UP, DOWN, LEFT, RIGHT = Position(-1, 0), Position(1, 0), Position(0, -1), Position(0, 1)
@@ -33,23 +64,32 @@ class Board:
     DIRECTIONS = UP, UP_RIGHT, RIGHT, DOWN_RIGHT, DOWN, DOWN_LEFT, LEFT, UP_LEFT
 
     # According to: http://ceur-ws.org/Vol-1107/paper2.pdf
-    MAX_TURNS = 60
+    MAX_TURNS = board_tables(SIZE).max_turns
 
-    def __init__(self, board: T.Optional[BoardState_t]) -> None:
+    def __init__(self, board: T.Optional[BoardState_t], size: int = SIZE) -> None:
         self._turns = 0
         self._board: BoardState_t = defaultdict(board_default)
 
+        if size != self.SIZE:
+            tables = board_tables(size)
+            self.SIZE = size
+            self.CORNERS = tables.corners
+            self.CORNER_DISTANCE = tables.corner_distance
+            self.POSITIONS = tables.positions
+            self.MAX_TURNS = tables.max_turns
+
         if board is None:
             for i, j in self.POSITIONS:
                 self[i, j] = Color.EMPTY
 
-            self[4, 4], self[4, 5] = Color.WHITE, Color.BLACK
-            self[5, 4], self[5, 5] = Color.BLACK, Color.WHITE
+            center = size // 2
+            self[center, center], self[center, center + 1] = Color.WHITE, Color.BLACK
+            self[center + 1, center], self[center + 1, center + 1] = Color.BLACK, Color.WHITE
         else:
             self._board.update(board.items())
 
     def __iter__(self) -> T.Iterator[T.MutableSequence[Color]]:
-        for i in range(0, 10):
+        for i in range(0, self.SIZE + 2):
             yield self[i]
 
     @T.overload
@@ -95,6 +135,10 @@ class Board:
     def turns(self) -> int:
         return self._turns
 
+    @property
+    def size(self) -> int:
+        return self.SIZE
+
     def score(self) -> T.Tuple[int, int]:
         score = Counter(
             self.board[pos] for pos in self.board.POSITIONS if self.board[pos] != Color.EMPTY
@@ -102,8 +146,22 @@ class Board:
 
         return score[Color.WHITE], score[Color.BLACK]
 
+    def to_bytes(self, color: T.Optional[Color] = None) -> bytes:
+        # Compact form, see othello.models.codec, only for the 8x8 board
+        from .codec import encode
+
+        return encode(self, color)
+
+    @classmethod
+    def from_bytes(cls, data: T.Union[bytes, bytearray, memoryview]) -> "Board":
+        from .codec import decode
+
+        return decode(data)[0]
+
     def get_clone(self) -> "Board":
-        return Board(self._board)
+        clone = Board(self._board, self.SIZE)
+        clone._turns = self._turns
+        return clone
 
     def valid_moves(self, color: T.Union[Color, str]) -> T.Sequence[Position]:
         ret = []
@@ -151,4 +209,4 @@ class Board:
         return None if bracket_color in (Color.OUTER, Color.EMPTY) else bracket_pos
 
 
-__all__ = ("Board",)
+__all__ = ("Board", "BoardTables", "board_tables")
@@ -0,0 +1,103 @@
+# Internal
+import typing as T
+
+# External
+import numpy as np
+
+# Project
+from ..enums import Color
+from .codec import POSITION, CODE_COLORS, COLOR_CODES, encode, board_from_masks
+
+if T.TYPE_CHECKING:
+    # Internal
+    from os import PathLike
+
+    # Project
+    from .board import Board
+
+# Same layout as othello.models.codec.POSITION, so encoded positions can be viewed as an array
+# without copying and arrays can be written out as a plain concatenation of positions
+POSITION_FIELDS = (("black", "<u8"), ("white", "<u8"), ("color", "u1"), ("turns", "u1"))
+POSITION_DTYPE = np.dtype(list(POSITION_FIELDS))
+assert POSITION_DTYPE.itemsize == POSITION.size
+
+# Cell values returned by to_cells
+EMPTY, BLACK, WHITE = 0, 1, 2
+
+
+def pack(
+    boards: T.Iterable["Board"], colors: T.Optional[T.Iterable[T.Optional[Color]]] = None
+) -> np.ndarray:
+    colors = colors if colors is not None else iter(lambda: None, 0)
+    return from_buffer(b"".join(encode(board, color) for board, color in zip(boards, colors)))
+
+
+def unpack(array: np.ndarray) -> T.List[T.Tuple["Board", T.Optional[Color]]]:
+    # Only the position fields are read, arrays with extra fields are accepted as well
+    columns = (array[name].tolist() for name, _ in POSITION_FIELDS)
+    return [
+        (board_from_masks(int(black), int(white), int(turns)), CODE_COLORS[int(color)])
+        for black, white, color, turns in zip(*columns)
+    ]
+
+
+def from_buffer(buffer: T.Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    # Zero copy view over encoded positions, read only when buffer is bytes
+    return np.frombuffer(buffer, dtype=POSITION_DTYPE)
+
+
+def _mask_bits(masks: np.ndarray) -> np.ndarray:
+    as_bytes = np.ascontiguousarray(masks, dtype="<u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little").reshape(-1, 8, 8)
+
+
+def to_cells(array: np.ndarray) -> np.ndarray:
+    # Shape (n, 8, 8), cells[i, x - 1, y - 1] is EMPTY, BLACK or WHITE
+    return T.cast(
+        np.ndarray,
+        (_mask_bits(array["black"]) * BLACK + _mask_bits(array["white"]) * WHITE).astype(np.int8),
+    )
+
+
+def _cells_mask(bits: np.ndarray) -> np.ndarray:
+    packed = np.packbits(bits.reshape(-1, 64).astype(np.uint8), axis=1, bitorder="little")
+    return packed.view("<u8").reshape(-1)
+
+
+def from_cells(
+    cells: np.ndarray,
+    colors: T.Optional[np.ndarray] = None,
+    turns: T.Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Inverse of to_cells, colors use the codes of COLOR_CODES. When turns is not given it is
+    # derived from the number of discs, which holds for any position reached by playing
+    array = np.zeros(len(cells), dtype=POSITION_DTYPE)
+    array["black"] = _cells_mask(cells == BLACK)
+    array["white"] = _cells_mask(cells == WHITE)
+    array["color"] = COLOR_CODES[None] if colors is None else colors
+    array["turns"] = (
+        np.count_nonzero(cells.reshape(len(cells), -1), axis=1) - 4 if turns is None else turns
+    )
+    return array
+
+
+def save(path: T.Union[str, "PathLike[str]"], array: np.ndarray) -> None:
+    np.save(path, array, allow_pickle=False)
+
+
+def load(path: T.Union[str, "PathLike[str]"], mmap: bool = True) -> np.ndarray:
+    # Memory mapped by default, large datasets are paged in as they are read
+    return T.cast(np.ndarray, np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False))
+
+
+__all__ = (
+    "POSITION_DTYPE",
+    "POSITION_FIELDS",
+    "load",
+    "pack",
+    "save",
+    "unpack",
+    "to_cells",
+    "from_cells",
+    "from_buffer",
+)
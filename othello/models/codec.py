@@ -0,0 +1,82 @@
+# Internal
+import struct
+import typing as T
+
+# Project
+from ..enums import Color
+from .bitboard import BITS, SQUARES, STANDARD, from_board
+from .position import Position
+
+if T.TYPE_CHECKING:
+    # Project
+    from .board import Board
+
+# Black mask, white mask, side to move (0 unknown, 1 black, 2 white) and turns. The masks alone
+# take 16 bytes, the two trailing bytes make positions self contained
+POSITION = struct.Struct("<QQBB")
+
+COLOR_CODES = {None: 0, Color.BLACK: 1, Color.WHITE: 2}
+CODE_COLORS = {code: color for color, code in COLOR_CODES.items()}
+
+# Moves take a single byte, the square index (x - 1) * 8 + (y - 1), or NO_MOVE
+NO_MOVE = 0xFF
+
+
+def _pack_args(board: "Board", color: T.Optional[Color]) -> T.Tuple[int, int, int, int]:
+    if board.size != STANDARD.size:
+        raise ValueError(f"Codificação suporta apenas tabuleiros {STANDARD.size}x{STANDARD.size}")
+
+    black, white = from_board(board)
+    return black, white, COLOR_CODES[color], board.turns
+
+
+def encode(board: "Board", color: T.Optional[Color] = None) -> bytes:
+    return POSITION.pack(*_pack_args(board, color))
+
+
+def encode_into(
+    buffer: T.Union[bytearray, memoryview], offset: int, board: "Board", color: T.Optional[Color]
+) -> None:
+    # Writes straight into buffer, e.g. shared memory, without an intermediate bytes object
+    POSITION.pack_into(buffer, offset, *_pack_args(board, color))
+
+
+def encode_move(move: T.Optional[T.Tuple[int, int]]) -> int:
+    return NO_MOVE if move is None else (move[0] - 1) * 8 + (move[1] - 1)
+
+
+def decode_move(code: int) -> T.Optional[Position]:
+    return None if code == NO_MOVE else SQUARES[code]
+
+
+def board_from_masks(black: int, white: int, turns: int = 0) -> "Board":
+    # Project
+    from .board import Board
+
+    board = Board(
+        {
+            square: Color.BLACK if black & bit else (Color.WHITE if white & bit else Color.EMPTY)
+            for square, bit in BITS.items()
+        }
+    )
+    board._turns = turns
+    return board
+
+
+def decode(
+    data: T.Union[bytes, bytearray, memoryview], offset: int = 0
+) -> T.Tuple["Board", T.Optional[Color]]:
+    black, white, color, turns = POSITION.unpack_from(data, offset)
+    return board_from_masks(black, white, turns), CODE_COLORS[color]
+
+
+__all__ = (
+    "NO_MOVE",
+    "POSITION",
+    "decode",
+    "encode",
+    "encode_into",
+    "decode_move",
+    "encode_move",
+    "board_from_masks",
+)
@@ -0,0 +1,128 @@
+# Internal
+import typing as T
+
+# Project
+from ..enums import Color
+from .board import board_tables
+from .position import Position
+from .bitboard import BITS, FULL, shift, popcount, neighbours, moves_mask, standard_split
+
+if T.TYPE_CHECKING:
+    # Project
+    from .board import Board
+
+
+def _mask(*squares: T.Tuple[int, int]) -> int:
+    return sum(BITS[Position(*square)] for square in squares)
+
+
+CORNERS_MASK = _mask((1, 1), (1, 8), (8, 1), (8, 8))
+X_SQUARES_MASK = _mask((2, 2), (2, 7), (7, 2), (7, 7))
+C_SQUARES_MASK = _mask((1, 2), (2, 1), (1, 7), (2, 8), (7, 1), (8, 2), (7, 8), (8, 7))
+
+# Squared distance from each square to its nearest corner
+CORNER_DISTANCE: T.Mapping[Position, int] = board_tables(8).corner_distance
+
+
+def _lines(direction: T.Tuple[int, int]) -> T.Tuple[int, ...]:
+    lines = set()
+    for x, y in BITS:
+        squares = ((x + k * direction[0], y + k * direction[1]) for k in range(-7, 8))
+        lines.add(_mask(*(square for square in squares if square in BITS)))
+    return tuple(lines)
+
+
+def _anchors(direction: T.Tuple[int, int]) -> int:
+    # Squares with an off board neighbour along the direction axis
+    backward = (-direction[0], -direction[1])
+    return ~(shift(FULL, direction) & shift(FULL, backward)) & FULL
+
+
+# Axis direction -> (every line of the board along it, squares anchored by the border)
+AXES: T.Mapping[T.Tuple[int, int], T.Tuple[T.Tuple[int, ...], int]] = {
+    direction: (_lines(direction), _anchors(direction))
+    for direction in ((0, 1), (1, 0), (1, 1), (1, -1))
+}
+
+
+class Features(T.NamedTuple):
+    mobility: int
+    opponent_mobility: int
+    potential_mobility: int
+    opponent_potential_mobility: int
+    frontier: int
+    opponent_frontier: int
+    stable: int
+    opponent_stable: int
+    corners: int
+    opponent_corners: int
+    x_squares: int
+    opponent_x_squares: int
+    c_squares: int
+    opponent_c_squares: int
+    empties: int
+    # Number of empty regions with an odd number of squares
+    parity: int
+
+
+def stable_mask(own: int, opp: int) -> int:
+    filled = own | opp
+    axes = tuple(
+        (direction, anchors | sum(line for line in lines if line & filled == line))
+        for direction, (lines, anchors) in AXES.items()
+    )
+
+    stable = 0
+    while True:
+        candidates = own & ~stable
+        for (dx, dy), anchored in axes:
+            candidates &= anchored | shift(stable, (dx, dy)) | shift(stable, (-dx, -dy))
+
+        if not candidates:
+            return stable
+
+        stable |= candidates
+
+
+def regions(empty: int) -> T.Iterator[int]:
+    while empty:
+        region = empty & -empty
+        while True:
+            grown = (region | neighbours(region)) & empty
+            if grown == region:
+                break
+            region = grown
+
+        empty &= ~region
+        yield region
+
+
+def extract_from_masks(own: int, opp: int) -> Features:
+    empty = ~(own | opp) & FULL
+    near_empty = neighbours(empty)
+
+    return Features(
+        mobility=popcount(moves_mask(own, opp)),
+        opponent_mobility=popcount(moves_mask(opp, own)),
+        potential_mobility=popcount(neighbours(opp) & empty),
+        opponent_potential_mobility=popcount(neighbours(own) & empty),
+        frontier=popcount(own & near_empty),
+        opponent_frontier=popcount(opp & near_empty),
+        stable=popcount(stable_mask(own, opp)),
+        opponent_stable=popcount(stable_mask(opp, own)),
+        corners=popcount(own & CORNERS_MASK),
+        opponent_corners=popcount(opp & CORNERS_MASK),
+        x_squares=popcount(own & X_SQUARES_MASK),
+        opponent_x_squares=popcount(opp & X_SQUARES_MASK),
+        c_squares=popcount(own & C_SQUARES_MASK),
+        opponent_c_squares=popcount(opp & C_SQUARES_MASK),
+        empties=popcount(empty),
+        parity=sum(popcount(region) % 2 for region in regions(empty)),
+    )
+
+
+def extract_features(board: "Board", color: T.Union[Color, str]) -> Features:
+    return extract_from_masks(*standard_split(board, color))
+
+
+__all__ = ("Features", "CORNER_DISTANCE", "extract_features", "extract_from_masks")
@@ -0,0 +1,69 @@
+# Internal
+import re
+import typing as T
+
+# Project
+from ..enums import Color
+from .position import Position
+
+# Column letters of the usual othello notation, rows are numbered from 1. Boards larger than 8x8
+# just continue the alphabet
+COLUMNS = "abcdefghijklmnop"
+MOVE_RE = re.compile(r"([a-p])(\d+)")
+
+
+def format_moves(moves: T.Iterable[T.Tuple[int, int]]) -> str:
+    # Passes are not recorded, they are implied when the side to move has no valid moves
+    return "".join(f"{COLUMNS[y - 1]}{x}" for x, y in moves)
+
+
+def parse_moves(moves: str) -> T.List[Position]:
+    parsed = MOVE_RE.findall(moves)
+    if sum(len(column) + len(row) for column, row in parsed) != len(moves):
+        raise ValueError(f"Lista de jogadas inválida: {moves}")
+
+    return [Position(int(row), COLUMNS.index(column) + 1) for column, row in parsed]
+
+
+class GameResult(T.NamedTuple):
+    black: str
+    white: str
+    winner: T.Optional[Color]
+    # Whether the game ended by W/O, because the loser failed to play
+    failure: bool
+    black_score: int
+    white_score: int
+    turns: int
+    # Seconds spent by each side choosing its moves
+    black_time: float = 0.0
+    white_time: float = 0.0
+    # Moves in the order they were played, see format_moves
+    moves: str = ""
+    # Seed given to the players, replaying the game with it reproduces the same moves
+    seed: T.Optional[int] = None
+    size: int = 8
+    # Whether the game was stopped early because its result was already decided
+    adjudicated: bool = False
+
+    def points(self, player: str) -> float:
+        if player not in (self.black, self.white):
+            raise ValueError(f"{player} não participou da partida")
+
+        if self.winner is None:
+            return 0.5
+
+        return 1.0 if (self.black if self.winner is Color.BLACK else self.white) == player else 0.0
+
+    def to_record(self) -> T.Dict[str, T.Any]:
+        record = self._asdict()
+        record["winner"] = self.winner and self.winner.value
+        return record
+
+    @classmethod
+    def from_record(cls, record: T.Mapping[str, T.Any]) -> "GameResult":
+        fields = {field: record[field] for field in cls._fields if field in record}
+        fields["winner"] = fields["winner"] and Color(fields["winner"])
+        return cls(**fields)
+
+
+__all__ = ("GameResult", "format_moves", "parse_moves")
@@ -0,0 +1,193 @@
+# Internal
+import typing as T
+from os import PathLike
+
+# External
+import numpy as np
+
+# Project
+from ..enums import Color
+from .board import Board
+from .position import Position
+from .bitboard import BITS, SQUARES, flips_mask, moves_mask, standard_split
+
+# Pattern name -> squares of its base instance, every other instance is a board symmetry of it
+PATTERNS: T.Mapping[str, T.Tuple[T.Tuple[int, int], ...]] = {
+    "edge_2x": ((2, 2), *((1, y) for y in range(1, 9)), (2, 7)),
+    "corner_3x3": tuple((x, y) for x in range(1, 4) for y in range(1, 4)),
+    "corner_2x5": tuple((x, y) for x in range(1, 3) for y in range(1, 6)),
+    "row_2": tuple((2, y) for y in range(1, 9)),
+    "row_3": tuple((3, y) for y in range(1, 9)),
+    "row_4": tuple((4, y) for y in range(1, 9)),
+    "diagonal_8": tuple((i, i) for i in range(1, 9)),
+    "diagonal_7": tuple((i, i + 1) for i in range(1, 8)),
+    "diagonal_6": tuple((i, i + 2) for i in range(1, 7)),
+    "diagonal_5": tuple((i, i + 3) for i in range(1, 6)),
+    "diagonal_4": tuple((i, i + 4) for i in range(1, 5)),
+}
+
+SYMMETRIES: T.Tuple[T.Callable[[int, int], T.Tuple[int, int]], ...] = (
+    lambda x, y: (x, y),
+    lambda x, y: (y, x),
+    lambda x, y: (9 - x, y),
+    lambda x, y: (x, 9 - y),
+    lambda x, y: (9 - x, 9 - y),
+    lambda x, y: (9 - y, x),
+    lambda x, y: (y, 9 - x),
+    lambda x, y: (9 - y, 9 - x),
+)
+
+# Board.turns is split into this many phases, each with its own set of weights
+PHASES = 10
+
+# Square content, relative to the evaluated color
+EMPTY, OWN, OPPONENT = range(3)
+
+
+def _instances(
+    squares: T.Tuple[T.Tuple[int, int], ...]
+) -> T.Tuple[T.Tuple[T.Tuple[int, int], ...], ...]:
+    found: T.Dict[T.FrozenSet[T.Tuple[int, int]], T.Tuple[T.Tuple[int, int], ...]] = {}
+    for symmetry in SYMMETRIES:
+        instance = tuple(symmetry(x, y) for x, y in squares)
+        found.setdefault(frozenset(instance), instance)
+    return tuple(found.values())
+
+
+def _build_tables() -> T.Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    square_index: T.Dict[T.Tuple[int, int], int] = {
+        square: idx for idx, square in enumerate(SQUARES)
+    }
+    width = max(len(squares) for squares in PATTERNS.values())
+
+    rows, powers, offsets = [], [], []
+    size = 0
+    for squares in PATTERNS.values():
+        for instance in _instances(squares):
+            padding = width - len(instance)
+            # Padding reads a dummy always empty cell (index 64) with weight 0
+            rows.append([square_index[square] for square in instance] + [64] * padding)
+            powers.append([3**k for k in range(len(instance))] + [0] * padding)
+            offsets.append(size)
+        size += 3 ** len(squares)
+
+    return (
+        np.array(rows, dtype=np.intp),
+        np.array(powers, dtype=np.int32),
+        np.array(offsets, dtype=np.int32),
+        size,
+    )
+
+
+# Every pattern instance: squares read, base-3 digit weights and offset into the packed weights
+INSTANCE_SQUARES, INSTANCE_POWERS, INSTANCE_OFFSETS, WEIGHTS_SIZE = _build_tables()
+
+
+def phase(turns: int) -> int:
+    return min(turns * PHASES // (Board.MAX_TURNS + 1), PHASES - 1)
+
+
+def cells_from_masks(own: int, opp: int) -> np.ndarray:
+    own_bits = np.unpackbits(
+        np.frombuffer(own.to_bytes(8, "little"), dtype=np.uint8), bitorder="little"
+    )
+    opp_bits = np.unpackbits(
+        np.frombuffer(opp.to_bytes(8, "little"), dtype=np.uint8), bitorder="little"
+    )
+    cells = np.zeros(65, dtype=np.int32)
+    cells[:64] = own_bits * OWN + opp_bits * OPPONENT
+    return cells
+
+
+def pattern_indices(cells: np.ndarray) -> np.ndarray:
+    return T.cast(
+        np.ndarray, (cells[INSTANCE_SQUARES] * INSTANCE_POWERS).sum(axis=-1) + INSTANCE_OFFSETS
+    )
+
+
+class PatternEvaluator:
+    def __init__(self, weights: T.Optional[np.ndarray] = None) -> None:
+        if weights is None:
+            weights = np.zeros((PHASES, WEIGHTS_SIZE), dtype=np.float32)
+
+        if weights.shape != (PHASES, WEIGHTS_SIZE):
+            raise ValueError(f"Pesos com formato inválido: {weights.shape}")
+
+        self.weights = weights
+
+    @classmethod
+    def load(cls, path: T.Union[str, "PathLike[str]"]) -> "PatternEvaluator":
+        with np.load(path) as data:
+            return cls(data["weights"].astype(np.float32))
+
+    def save(self, path: T.Union[str, "PathLike[str]"]) -> None:
+        np.savez_compressed(path, weights=self.weights)
+
+    def evaluate_masks(self, own: int, opp: int, turns: int) -> float:
+        return float(self.weights[phase(turns), pattern_indices(cells_from_masks(own, opp))].sum())
+
+    # Predicted final disc difference in favour of color
+    def evaluate(self, board: Board, color: T.Union[Color, str]) -> float:
+        return self.evaluate_masks(*standard_split(board, color), board.turns)
+
+
+class PatternTrainer:
+    def __init__(self, evaluator: T.Optional[PatternEvaluator] = None) -> None:
+        self.evaluator = evaluator or PatternEvaluator()
+        self._samples: T.List[T.List[T.Tuple[np.ndarray, float]]] = [[] for _ in range(PHASES)]
+
+    def add_position(self, board: Board, color: T.Union[Color, str], target: float) -> None:
+        own, opp = standard_split(board, color)
+        self._samples[phase(board.turns)].append(
+            (pattern_indices(cells_from_masks(own, opp)), target)
+        )
+
+    def add_game(self, moves: T.Iterable[T.Tuple[int, int]]) -> None:
+        black, white = standard_split(Board(None), Color.BLACK)
+        black_to_move = True
+        positions: T.List[T.Tuple[int, int, int]] = []
+        for turns, move in enumerate(moves, 1):
+            own, opp = (black, white) if black_to_move else (white, black)
+            if not moves_mask(own, opp):
+                # Player had to pass
+                black_to_move = not black_to_move
+                own, opp = opp, own
+
+            move_bit = BITS[Position(*move)]
+            if not moves_mask(own, opp) & move_bit:
+                raise ValueError(f"Movimento inválido na rodada {turns}: {move}")
+
+            flips = flips_mask(own, opp, move_bit)
+            own, opp = own | flips | move_bit, opp & ~flips
+            black, white = (own, opp) if black_to_move else (opp, own)
+            positions.append((black, white, turns))
+            black_to_move = not black_to_move
+
+        result = bin(black).count("1") - bin(white).count("1")
+        for black, white, turns in positions:
+            samples = self._samples[phase(turns)]
+            samples.append((pattern_indices(cells_from_masks(black, white)), result))
+            samples.append((pattern_indices(cells_from_masks(white, black)), -result))
+
+    def fit(self, epochs: int = 20, learning_rate: float = 0.5) -> PatternEvaluator:
+        weights = self.evaluator.weights
+        for phase_idx, samples in enumerate(self._samples):
+            if not samples:
+                continue
+
+            indices = np.stack([idx for idx, _ in samples])
+            targets = np.array([target for _, target in samples], dtype=np.float32)
+            counts = np.maximum(np.bincount(indices.ravel(), minlength=WEIGHTS_SIZE), 1)
+
+            phase_weights = weights[phase_idx]
+            for _ in range(epochs):
+                errors = targets - phase_weights[indices].sum(axis=1)
+                gradient = np.zeros(WEIGHTS_SIZE, dtype=np.float32)
+                np.add.at(gradient, indices, errors[:, None])
+                # Average the error over every sample where each weight was used
+                phase_weights += learning_rate * gradient / counts / indices.shape[1]
+
+        return self.evaluator
+
+
+__all__ = ("PATTERNS", "PatternTrainer", "PatternEvaluator")
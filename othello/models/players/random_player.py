@@ -11,9 +11,14 @@ if T.TYPE_CHECKING:
 class RandomPlayer:
     def __init__(self, color: "Color") -> None:
         self.color = color
+        # Own generator, so seeding a player doesn't affect others playing in the same process
+        self._random = random.Random()
+
+    def seed(self, seed: int) -> None:
+        self._random.seed(seed)
 
     def play(self, board: "Board") -> "Position":
-        return random.choice(board.valid_moves(self.color))
+        return self._random.choice(board.valid_moves(self.color))
 
 
 __all__ = ("RandomPlayer",)
@@ -0,0 +1,191 @@
+# Internal
+import typing as T
+
+# Project
+from ..enums import Color
+from .board import Board
+from .bitboard import STANDARD, Geometry, split, popcount, geometry, flips_mask, moves_mask
+
+# Game theoretic results, from the point of view of the side to move
+WIN, DRAW, LOSS = 1, 0, -1
+
+# Proof and disproof numbers are capped here, a node with one of them at INFINITY is solved
+INFINITY = 1 << 40
+
+# Smaller tables can't even hold the siblings along the current path, the search would keep
+# recomputing the same nodes
+MIN_TABLE_SIZE = 256
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class ProofNumberSearch:
+    # Depth first proof number search (df-pn) over bitboards. Instead of the exact score it only
+    # decides whether the side to move ends the game with more than threshold discs over the
+    # opponent, which needs far fewer nodes. Proof and disproof numbers are kept in a table of at
+    # most table_size positions, when it fills the entries that took the least work to compute
+    # are dropped, so long searches run in bounded memory
+    def __init__(self, table_size: int = 1 << 20, geo: Geometry = STANDARD) -> None:
+        if table_size < MIN_TABLE_SIZE:
+            raise ValueError(f"Tabela deve ter ao menos {MIN_TABLE_SIZE} posições")
+
+        self.geo = geo
+        self.table_size = table_size
+        self.nodes = 0
+        self.collections = 0
+        # (own, opp, threshold) -> (pn, dn, work)
+        self._table: T.Dict[T.Tuple[int, int, int], T.Tuple[int, int, int]] = {}
+        self._budget = 0
+
+    def prove(
+        self, own: int, opp: int, threshold: int = 0, budget: T.Optional[int] = None
+    ) -> T.Optional[bool]:
+        # True if the side to move can finish with a disc difference above threshold, False if it
+        # can't, None if more than budget nodes would be needed to tell
+        self._budget = self.nodes + budget if budget is not None else INFINITY
+        key = (own, opp, threshold)
+        try:
+            self._search(own, opp, threshold, INFINITY, INFINITY)
+        except BudgetExceeded:
+            return None
+
+        pn, dn, _ = self._table[key]
+        return True if pn == 0 else (False if dn == 0 else None)
+
+    def outcome(self, own: int, opp: int, budget: T.Optional[int] = None) -> T.Optional[int]:
+        # WIN, DRAW or LOSS for the side to move with perfect play, None if the budget runs out.
+        # Two questions, whether it wins and whether it at least draws, share the same budget
+        start = self.nodes
+        wins = self.prove(own, opp, 0, budget)
+        if wins is None or wins:
+            return None if wins is None else WIN
+
+        draws = self.prove(own, opp, -1, None if budget is None else budget - (self.nodes - start))
+        return None if draws is None else (DRAW if draws else LOSS)
+
+    def clear(self) -> None:
+        self._table.clear()
+
+    def _collect(self) -> None:
+        # Keeps the half of the table that took the most work, solved entries first, as they are
+        # the most expensive to find again
+        entries = sorted(
+            self._table.items(),
+            key=lambda item: (item[1][0] == 0 or item[1][1] == 0, item[1][2]),
+            reverse=True,
+        )
+        self._table = dict(entries[: self.table_size // 2])
+        self.collections += 1
+
+    def _store(self, key: T.Tuple[int, int, int], pn: int, dn: int, work: int) -> None:
+        if len(self._table) >= self.table_size and key not in self._table:
+            self._collect()
+        self._table[key] = (pn, dn, work)
+
+    def _children(self, own: int, opp: int, moves: int) -> T.List[T.Tuple[int, int]]:
+        # Positions after each move, from the point of view of the opponent
+        if not moves:
+            # Pass, the only child is the same position with the sides swapped
+            return [(opp, own)]
+
+        children = []
+        while moves:
+            move = moves & -moves
+            moves ^= move
+            flips = flips_mask(own, opp, move, self.geo)
+            children.append((opp & ~flips, own | flips | move))
+        return children
+
+    def _search(self, own: int, opp: int, threshold: int, pn_limit: int, dn_limit: int) -> None:
+        self.nodes += 1
+        if self.nodes > self._budget:
+            raise BudgetExceeded()
+
+        start = self.nodes
+        key = (own, opp, threshold)
+
+        moves = moves_mask(own, opp, self.geo)
+        if not moves and not moves_mask(opp, own, self.geo):
+            won = popcount(own) - popcount(opp) > threshold
+            self._store(key, 0 if won else INFINITY, INFINITY if won else 0, 1)
+            return
+
+        # Negamax form: the side to move proves its goal if any child disproves the opponent's
+        # goal. Scores are integers, so own > t is the same as opponent >= -t, not opponent > -t-1
+        child_threshold = -threshold - 1
+        children = [(*child, child_threshold) for child in self._children(own, opp, moves)]
+
+        while True:
+            dn, best, best_dn, second_dn = 0, None, INFINITY, INFINITY
+            for child in children:
+                child_pn, child_dn, _ = self._table.get(child, (1, 1, 0))
+                dn = min(dn + child_pn, INFINITY)
+                if child_dn < best_dn:
+                    best, second_dn, best_dn = child, best_dn, child_dn
+                elif child_dn < second_dn:
+                    second_dn = child_dn
+            pn = best_dn
+
+            if pn >= pn_limit or dn >= dn_limit:
+                break
+
+            assert best is not None
+            best_pn = self._table.get(best, (1, 1, 0))[0]
+            self._search(
+                *best,
+                min(dn_limit - dn + best_pn, INFINITY),
+                min(pn_limit, second_dn + 1),
+            )
+
+        self._store(key, pn, dn, self.nodes - start + 1)
+
+
+def board_outcome(
+    board: Board, color: T.Union[Color, str], budget: T.Optional[int] = None
+) -> T.Optional[int]:
+    # WIN, DRAW or LOSS for color, playing next on board. A new table per call, callers solving
+    # many positions should keep their own ProofNumberSearch
+    return ProofNumberSearch(geo=geometry(board.size)).outcome(*split(board, color), budget)
+
+
+class Adjudicator:
+    # Called after each move, with the side to move next. Positions with more than max_empties
+    # empty squares, or where neither side can move, are left alone. Otherwise df-pn tries to
+    # prove whether that side wins, then whether it draws, with budget nodes shared by both
+    # proofs. A proven outcome ends the game, when the budget runs out the game is played on.
+    # One table per board size is kept between calls
+    def __init__(
+        self, max_empties: int = 12, budget: int = 20_000, table_size: int = 1 << 18
+    ) -> None:
+        self.max_empties = max_empties
+        self.budget = budget
+        self.table_size = table_size
+        self._searches: T.Dict[int, ProofNumberSearch] = {}
+
+    def __call__(self, board: Board, color: Color) -> T.Optional[int]:
+        geo = geometry(board.size)
+        own, opp = split(board, color)
+        if popcount(~(own | opp) & geo.full) > self.max_empties:
+            return None
+
+        if not (moves_mask(own, opp, geo) or moves_mask(opp, own, geo)):
+            # Already over, nothing to adjudicate
+            return None
+
+        search = self._searches.get(board.size)
+        if search is None:
+            search = self._searches[board.size] = ProofNumberSearch(self.table_size, geo)
+        return search.outcome(own, opp, self.budget)
+
+
+__all__ = (
+    "WIN",
+    "DRAW",
+    "LOSS",
+    "Adjudicator",
+    "board_outcome",
+    "BudgetExceeded",
+    "ProofNumberSearch",
+)
@@ -0,0 +1,177 @@
+# Internal
+import os
+import typing as T
+
+# External
+import numpy as np
+
+# Project
+from ..enums import Color
+from .codec import COLOR_CODES, encode_move
+from .position import Position
+from .bitboard import BITS, popcount, flips_mask, moves_mask
+from .bulk_codec import POSITION_FIELDS
+
+if T.TYPE_CHECKING:
+    # Internal
+    from os import PathLike
+
+# The position fields come first and match POSITION_DTYPE, so records can be passed straight to
+# the bulk_codec functions. result (1 win, 0 draw, -1 loss) and score (final disc difference) are
+# from the point of view of the side to move. game is 0 for slots never written
+RECORD_DTYPE = np.dtype(
+    [
+        *POSITION_FIELDS,
+        ("move", "u1"),
+        ("result", "i1"),
+        ("score", "i1"),
+        ("game", "<u4"),
+        ("priority", "<f4"),
+    ]
+)
+
+
+class ReplayBuffer:
+    # Fixed capacity ring of the positions of past games, preallocated up front, so memory stays
+    # the same no matter how many games are played. When a path is given the ring is a memory
+    # mapped .npy file, which also lets it be kept between training sessions
+    def __init__(
+        self,
+        capacity: int,
+        path: T.Optional[T.Union[str, "PathLike[str]"]] = None,
+        seed: T.Optional[int] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacidade da memória de treino deve ser positiva")
+
+        self.capacity = capacity
+        self._rng = np.random.default_rng(seed)
+
+        if path is None:
+            self._data = np.zeros(capacity, dtype=RECORD_DTYPE)
+        elif os.path.exists(path):
+            self._data = np.lib.format.open_memmap(path, mode="r+")
+            if self._data.dtype != RECORD_DTYPE or self._data.shape != (capacity,):
+                raise ValueError(f"Memória de treino em {path} tem outro formato ou capacidade")
+        else:
+            self._data = np.lib.format.open_memmap(
+                path, mode="w+", dtype=RECORD_DTYPE, shape=(capacity,)
+            )
+
+        # Recovered from the game ids, which only grow, when reopening a file. The ring continues
+        # after the last slot of the newest game, which may wrap around the end of the array
+        games = self._data["game"]
+        self._size = int(np.count_nonzero(games))
+        self._games = int(games.max()) if self._size else 0
+        newest = games == self._games
+        ends = newest & ~np.roll(newest, -1)
+        last = int(ends.argmax()) if self._size and ends.any() else -1
+        self._next = (last + 1) % capacity
+        self._max_priority = float(self._data["priority"][: self._size].max(initial=1.0))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def games(self) -> int:
+        return self._games
+
+    def add_game(
+        self,
+        moves: T.Sequence[T.Tuple[int, int]],
+        winner: T.Optional[Color],
+        priority: T.Optional[float] = None,
+    ) -> np.ndarray:
+        # Replays the moves of a whole 8x8 game, from the initial position, storing the position
+        # before each move. Returns the indices written. New positions get the highest priority
+        # seen so far, so they are likely to be sampled at least once
+        records = np.zeros(len(moves), dtype=RECORD_DTYPE)
+        own = BITS[Position(4, 5)] | BITS[Position(5, 4)]
+        opp = BITS[Position(4, 4)] | BITS[Position(5, 5)]
+        color = Color.BLACK
+        for turn, move in enumerate(moves):
+            bit = BITS[Position(*move)]
+            if not moves_mask(own, opp) & bit:
+                # Passes are not recorded, the move must be from the other side
+                own, opp, color = opp, own, color.opposite()
+
+            record = records[turn]
+            record["black"], record["white"] = (own, opp) if color is Color.BLACK else (opp, own)
+            record["color"] = COLOR_CODES[color]
+            record["turns"] = turn
+            record["move"] = encode_move(move)
+
+            flips = flips_mask(own, opp, bit)
+            own, opp, color = opp & ~flips, own | flips | bit, color.opposite()
+
+        black, white = (own, opp) if color is Color.BLACK else (opp, own)
+        black_wins = 0 if winner is None else (1 if winner is Color.BLACK else -1)
+        black_score = popcount(black) - popcount(white)
+        sign = np.where(records["color"] == COLOR_CODES[Color.BLACK], 1, -1)
+        records["result"] = sign * black_wins
+        records["score"] = sign * black_score
+
+        self._games += 1
+        records["game"] = self._games
+        records["priority"] = self._max_priority if priority is None else priority
+
+        return self._write(records)
+
+    def sample(
+        self, batch_size: int, prioritized: bool = False, alpha: float = 0.6
+    ) -> T.Tuple[np.ndarray, np.ndarray]:
+        # Indices and a copy of the sampled records, with replacement. Prioritized sampling picks
+        # each position with probability proportional to priority ** alpha
+        if not self._size:
+            raise ValueError("Memória de treino vazia")
+
+        if prioritized:
+            weights = self._data["priority"][: self._size].astype(np.float64) ** alpha
+            indices = self._rng.choice(self._size, batch_size, p=weights / weights.sum())
+        else:
+            indices = self._rng.integers(0, self._size, batch_size)
+
+        return indices, self._data[indices]
+
+    def importance_weights(
+        self, indices: np.ndarray, alpha: float = 0.6, beta: float = 0.4
+    ) -> np.ndarray:
+        # Corrects the bias of prioritized sampling, normalized so the largest weight is 1
+        weights = self._data["priority"][: self._size].astype(np.float64) ** alpha
+        probabilities = weights[indices] / weights.sum()
+        corrections = (self._size * probabilities) ** -beta
+        return T.cast(np.ndarray, corrections / corrections.max())
+
+    def update_priorities(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        priorities = np.maximum(np.asarray(priorities, dtype=np.float32), 1e-6)
+        self._data["priority"][indices] = priorities
+        self._max_priority = max(self._max_priority, float(priorities.max()))
+
+    def flush(self) -> None:
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+
+    def close(self) -> None:
+        self.flush()
+        # Releases the mapping, the buffer can't be used afterwards
+        del self._data
+
+    def __enter__(self) -> "ReplayBuffer":
+        return self
+
+    def __exit__(self, *_: T.Any) -> None:
+        self.close()
+
+    def _write(self, records: np.ndarray) -> np.ndarray:
+        # Games longer than the whole ring keep only their last positions, from the first slot
+        if len(records) >= self.capacity:
+            records, self._next = records[-self.capacity :], 0
+
+        indices = (self._next + np.arange(len(records))) % self.capacity
+        self._data[indices] = records
+        self._next = (self._next + len(records)) % self.capacity
+        self._size = min(self._size + len(records), self.capacity)
+        return T.cast(np.ndarray, indices)
+
+
+__all__ = ("RECORD_DTYPE", "ReplayBuffer")
@@ -0,0 +1,126 @@
+# Internal
+import math
+import typing as T
+
+# Project
+from .bitboard import STANDARD, Geometry, popcount, flips_mask, moves_mask
+from .position import Position
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..misc.position_store import PositionStore
+
+# Evaluates a position from the point of view of the side to move (own)
+Evaluate_t = T.Callable[[int, int, Geometry], float]
+
+
+def final_score(own: int, opp: int) -> float:
+    return float(popcount(own) - popcount(opp))
+
+
+def heuristic(own: int, opp: int, geo: Geometry = STANDARD) -> float:
+    # Cheap estimate of how the game is going, mobility and corners weigh the most before the end
+    return (
+        popcount(moves_mask(own, opp, geo))
+        - popcount(moves_mask(opp, own, geo))
+        + 4 * (popcount(own & geo.corners) - popcount(opp & geo.corners))
+    )
+
+
+def negamax(
+    own: int,
+    opp: int,
+    depth: int,
+    alpha: float = -math.inf,
+    beta: float = math.inf,
+    evaluate: Evaluate_t = heuristic,
+    geo: Geometry = STANDARD,
+) -> float:
+    moves = moves_mask(own, opp, geo)
+    if not moves:
+        if not moves_mask(opp, own, geo):
+            return final_score(own, opp)
+
+        # Pass, doesn't count as a ply
+        return -negamax(opp, own, depth, -beta, -alpha, evaluate, geo)
+
+    if depth <= 0:
+        return evaluate(own, opp, geo)
+
+    best = -math.inf
+    while moves:
+        move = moves & -moves
+        moves ^= move
+        flips = flips_mask(own, opp, move, geo)
+        value = -negamax(opp & ~flips, own | flips | move, depth - 1, -beta, -alpha, evaluate, geo)
+        if value > best:
+            best = value
+            if best > alpha:
+                alpha = best
+                if alpha >= beta:
+                    break
+
+    return best
+
+
+def score_moves(
+    own: int,
+    opp: int,
+    depth: int,
+    evaluate: Evaluate_t = heuristic,
+    geo: Geometry = STANDARD,
+    store: T.Optional["PositionStore"] = None,
+) -> T.Dict[Position, float]:
+    # Every root move is searched with a full window, so all values are exact, not only the best,
+    # and can be kept in the store for the next time the same position shows up
+    scores = {}
+    moves = moves_mask(own, opp, geo)
+    while moves:
+        move = moves & -moves
+        moves ^= move
+        flips = flips_mask(own, opp, move, geo)
+        scores[geo.squares[move.bit_length() - 1]] = -_stored_negamax(
+            opp & ~flips, own | flips | move, depth - 1, evaluate, geo, store
+        )
+
+    return scores
+
+
+def solve(
+    own: int, opp: int, geo: Geometry = STANDARD, store: T.Optional["PositionStore"] = None
+) -> float:
+    # Searching as deep as there are empty squares never reaches the evaluation, so the result is
+    # the exact final disc difference with perfect play. Only practical on small boards or near
+    # the end of the game
+    empties = popcount(~(own | opp) & geo.full)
+    return _stored_negamax(own, opp, empties, heuristic, geo, store)
+
+
+def _stored_negamax(
+    own: int,
+    opp: int,
+    depth: int,
+    evaluate: Evaluate_t,
+    geo: Geometry,
+    store: T.Optional["PositionStore"],
+) -> float:
+    # Stores only hold 8x8 positions, whose masks fit in 64 bits
+    if store is None or geo is not STANDARD:
+        return negamax(own, opp, depth, evaluate=evaluate, geo=geo)
+
+    # Project
+    from ..misc.position_store import EXACT
+
+    # Deep enough to reach the end of the game, the value doesn't depend on the evaluation. Other
+    # values do, so a store must always be used with the same evaluation
+    exact = depth >= popcount(~(own | opp) & geo.full)
+    stored = store.get(own, opp, EXACT if exact else depth)
+    if stored is not None:
+        return stored.value
+
+    value = negamax(own, opp, depth, evaluate=evaluate, geo=geo)
+    store.put(own, opp, value, EXACT if exact else min(depth, EXACT - 1))
+    return value
+
+
+__all__ = ("solve", "heuristic", "negamax", "Evaluate_t", "final_score", "score_moves")
@@ -1,2 +1,13 @@
+# Internal
+import typing as T
+
 # Project
-from .console_view import ConsoleView
+from ..misc.lazy_import import lazy_attributes
+
+if T.TYPE_CHECKING:
+    # Project
+    from .console_view import ConsoleView
+
+__getattr__ = lazy_attributes(__name__, {"ConsoleView": ".console_view"})
+
+__all__ = ("ConsoleView",)
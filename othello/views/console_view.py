@@ -8,7 +8,11 @@ from shutil import get_terminal_size
 from ..enums import Color
 from ..abstract import AbstractTrainingView, TrainingPlayerProtocol
 from ..adapters import BoardAdapter, BoardTrainingAdapter
-from ..misc.runtime_importer import available_players
+from ..misc.clock import format_clock
+from ..misc.rating import SPRT, MatchStats
+from ..misc.throttle import Throttle
+from ..misc.checkpoint import Checkpoint
+from ..misc.runtime_importer import import_player, available_players
 
 if T.TYPE_CHECKING:
     # Internal
@@ -27,15 +31,42 @@ class ConsoleView(AbstractTrainingView):
     ASK_MSG = "Selecione um dos players abaixo para ser o jogador"
 
     @staticmethod
-    def print_view_data(adapter: BoardAdapter) -> None:
-        print("┌─────────────────────┐")
-        print("│     1 2 3 4 5 6 7 8 │")
-        print("├───┬─────────────────┤")
+    def format_view_data(adapter: BoardAdapter) -> str:
+        # Boards larger than 9x9 need wider cells to fit the labels
+        width = len(str(adapter.size))
+        header = " ".join(f"{i:>{width}}" for i in range(1, adapter.size + 1))
+        inner = len(header) + width + 5
+        lines = [
+            f"┌{'─' * inner}┐",
+            f"│ {' ' * width}   {header} │",
+            f"├{'─' * (width + 2)}┬{'─' * (inner - width - 3)}┤",
+        ]
 
         for i, column in enumerate(adapter.view_data):
-            print(f"│ {i + 1} │ " + " ".join(v.value for v in column) + " │")
+            lines.append(
+                f"│ {i + 1:>{width}} │ " + " ".join(f"{v.value:>{width}}" for v in column) + " │"
+            )
+
+        lines.append(f"└{'─' * (width + 2)}┴{'─' * (inner - width - 3)}┘")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_score(adapter: BoardAdapter) -> str:
+        score = "Score: " + " ".join(
+            f"{repr(color)} = {score}" for color, score in adapter.score.items()
+        )
+        if adapter.clock is None:
+            return score
 
-        print("└───┴─────────────────┘")
+        clock = adapter.clock
+        return f"{score}\nRelógio: " + " ".join(
+            f"{repr(color)} = {format_clock(clock.remaining(color))}" for color in Color.valid()
+        )
+
+    @classmethod
+    def print_view_data(cls, adapter: BoardAdapter) -> None:
+        print(cls.format_view_data(adapter))
 
     class Model(AbstractTrainingView.Model["ConsoleView"]):
         def show(self, view: "ConsoleView") -> T.Sequence[T.Optional[str]]:
@@ -58,32 +89,49 @@ class ConsoleView(AbstractTrainingView):
     def available(cls) -> bool:
         return True
 
+    def __init__(self, *args: T.Any, **kwargs: T.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._columns: T.Optional[int] = None
+
     def loop(self) -> None:
         print(LOGO)
 
         all_players = available_players(self.player_paths)
+        black = self.ask_for_player(f"{self.ASK_MSG} {repr(Color.BLACK)}", all_players)
+        white = self.ask_for_player(f"{self.ASK_MSG} {repr(Color.WHITE)}", all_players)
+
+        if self.games > 1:
+            return self.match_loop(black, white)
+
         adapter = BoardAdapter(
-            self.ask_for_player(f"{self.ASK_MSG} {repr(Color.BLACK)}", all_players),
-            self.ask_for_player(f"{self.ASK_MSG} {repr(Color.WHITE)}", all_players),
+            black,
+            white,
+            profiler=self.profiler,
+            ponder=self.ponder,
+            sink=self.result_sink,
+            seed=self.game_seed(0),
+            size=self.size,
+            clock=self.game_clock(),
         )
 
+        # Quiet mode never waits for the user, otherwise there would be nothing to wait for
+        automatic = self.automatic or self.quiet
+        throttle = Throttle(self.max_fps if automatic else 0)
+
         finished = False
         while not finished:
-            if not self.automatic:
+            if not automatic:
                 input()
 
             color = adapter.current_color
+            rendered = not self.quiet and throttle.ready()
 
-            self.print_view_data(adapter)
-            print(
-                (
-                    "Score: "
-                    + " ".join(
-                        f"{repr(color)} = {score}" for color, score in adapter.score.items()
-                    )
+            if rendered:
+                # Whole frame in a single write, instead of a print call per line
+                sys.stdout.write(
+                    f"{self.format_view_data(adapter)}\n{self.format_score(adapter)}\n"
+                    f"Rodada do jogador: {repr(color)} ({color.value})\n\n"
                 )
-            )
-            print(f"Rodada do jogador: {repr(color)} ({color.value})\n")
 
             try:
                 update = adapter.update(self)
@@ -96,18 +144,17 @@ class ConsoleView(AbstractTrainingView):
 
                 break
 
-            if not update:
+            if rendered and not update:
                 print(f"Sem movimentos para o jogador")
 
-        print()
+        self.save_profiling()
+        self.close_results()
 
-        self.print_view_data(adapter)
-        print(
-            (
-                "Score: "
-                + " ".join(f"{repr(color)} = {score}" for color, score in adapter.score.items())
-            )
-        )
+        if not self.quiet:
+            print()
+            self.print_view_data(adapter)
+
+        print(self.format_score(adapter))
 
         if adapter.failure:
             assert adapter.winner
@@ -118,46 +165,200 @@ class ConsoleView(AbstractTrainingView):
             else:
                 print("Empate")
 
+    def match_loop(self, first: "ModuleInfo", second: "ModuleInfo") -> None:
+        names = (first.name, second.name)
+        if names[0] == names[1]:
+            names = (f"{names[0]} (1)", f"{names[1]} (2)")
+
+        stats = MatchStats(*names)
+        sprt = SPRT(stats, *self.sprt) if self.sprt else None
+        throttle = Throttle(self.max_fps)
+        checkpoint = Checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+        # Shared by every game, positions solved in one game are reused by the next ones
+        adjudicator = self.adjudicator()
+
+        first_game = 0
+        if checkpoint:
+            # Games already recorded by an interrupted run are not played again
+            for result in checkpoint.resume(
+                {"mode": "match", "players": list(names), "seed": self.seed, "size": self.size}
+            ).results:
+                stats.update(result)
+                first_game += 1
+
+        try:
+            for game in range(first_game, self.games):
+                # Alternate colors, so neither player keeps the first move advantage
+                black, white = (first, second) if game % 2 == 0 else (second, first)
+                black_name, white_name = names if game % 2 == 0 else names[::-1]
+                adapter = BoardAdapter(
+                    black,
+                    white,
+                    profiler=self.profiler,
+                    ponder=self.ponder,
+                    sink=self.result_sink,
+                    names=(black_name, white_name),
+                    seed=self.game_seed(game),
+                    size=self.size,
+                    adjudicator=adjudicator,
+                    clock=self.game_clock(),
+                )
+
+                while not adapter.finished():
+                    try:
+                        adapter.update(self)
+                    except Exception as exc:
+                        if self.debug:
+                            traceback.print_exc()
+                        else:
+                            self.alert(f"ERROR: {exc}")
+
+                        break
+
+                result = adapter.result()
+                stats.update(result)
+                if checkpoint:
+                    checkpoint.add_result(result)
+
+                if not self.quiet and throttle.ready():
+                    self.update_line(
+                        f"Partida {stats.games}/{self.games}: +{stats.wins} ={stats.draws} "
+                        f"-{stats.losses}, Elo {stats.elo()}"
+                    )
+
+                if sprt and sprt.decision() is not None:
+                    break
+        finally:
+            self.save_profiling()
+            self.close_results()
+
+            if checkpoint:
+                checkpoint.close()
+
+            if not self.quiet:
+                print()
+
+            print(
+                f"{stats.player} contra {stats.opponent}: {stats.games} partidas, "
+                f"Vitórias: {stats.wins}, Empates: {stats.draws}, Derrotas: {stats.losses}"
+            )
+            print(f"Diferença de Elo (IC 95%): {stats.elo()}")
+
+            if sprt:
+                decision = sprt.decision()
+                print(
+                    f"SPRT [{sprt.elo0}, {sprt.elo1}]: LLR {sprt.llr():.2f} "
+                    f"({sprt.lower:.2f}, {sprt.upper:.2f}), "
+                    + ("inconclusivo" if decision is None else f"H{int(decision)} aceita")
+                )
+
     def training_loop(self) -> None:
         print(LOGO)
         print(" # Training Mode # ")
 
         all_players = available_players(self.player_paths)
         keep_running = True
-        training_player: T.Union["ModuleInfo", "TrainingPlayerProtocol"] = self.ask_for_player(
+        training_module = self.ask_for_player(
             f"Selecione o jogador ({repr(Color.BLACK)}) para treino", all_players
         )
         competing_player = self.ask_for_player(f"{self.ASK_MSG} {repr(Color.WHITE)}", all_players)
+        names = (training_module.name, competing_player.name)
+        training_player: T.Union["ModuleInfo", "TrainingPlayerProtocol"] = training_module
         counter = {"game": 0, "round": 0}
+        results = {Color.BLACK: 0, Color.WHITE: 0, None: 0}
+        throttle = Throttle(self.max_fps)
+        checkpoint = Checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+        replay_buffer = self.replay_buffer()
+
+        if checkpoint:
+            state = checkpoint.resume(
+                {"mode": "training", "players": list(names), "seed": self.seed, "size": self.size}
+            )
+            for result in state.results:
+                counter["game"] += 1
+                results[result.winner] += 1
+
+            if state.player_state is not None:
+                player_cls: T.Callable[[Color], TrainingPlayerProtocol] = import_player(
+                    training_module, TrainingPlayerProtocol
+                )
+                player = player_cls(Color.BLACK)
+                load_state = getattr(player, "load_state", None)
+                if callable(load_state):
+                    load_state(state.player_state)
+                training_player = player
+
+        try:
+            while keep_running:
+                adapter = BoardTrainingAdapter(
+                    training_player,
+                    competing_player,
+                    profiler=self.profiler,
+                    ponder=self.ponder,
+                    sink=self.result_sink,
+                    names=names,
+                    seed=self.game_seed(counter["game"]),
+                    size=self.size,
+                    replay_buffer=replay_buffer,
+                    clock=self.game_clock(),
+                )
+                counter["game"] += 1
+                # Cache training player for consecutive games
+                training_player = adapter.training_player
 
-        while keep_running:
-            adapter = BoardTrainingAdapter(training_player, competing_player)
-            counter["game"] += 1
-            # Cache training player for consecutive games
-            training_player = adapter.training_player
+                while not adapter.finished():
+                    counter["round"] += 1
 
-            while not adapter.finished:
-                counter["round"] += 1
+                    if not self.quiet and throttle.ready():
+                        self.update_line(f"Partida {counter['game']}, Rodada {counter['round']}")
 
-                self.update_line(f"Partida {counter['game']}, Rodada {counter['round']}")
+                    try:
+                        update = adapter.update(self)
+                    except Exception as exc:
+                        if self.debug:
+                            traceback.print_exc()
+                        else:
+                            self.alert(f"ERROR: {exc}")
 
-                try:
-                    update = adapter.update(self)
-                except Exception as exc:
-                    if self.debug:
-                        traceback.print_exc()
-                    else:
-                        self.alert(f"ERROR: {exc}")
+                        if not self.automatic:
+                            answer = self.input("Continuar treino? (Y/n)") or "Y"
+                            if answer not in ("y", "Y"):
+                                keep_running = False
 
-                    if not self.automatic:
-                        answer = self.input("Continuar treino? (Y/n)") or "Y"
-                        if answer not in ("y", "Y"):
-                            keep_running = False
+                        break
 
-                    break
+                    if not update:
+                        continue
+
+                results[adapter.winner] += 1
+
+                if checkpoint:
+                    checkpoint.add_result(adapter.result())
+
+                    dump_state = getattr(training_player, "dump_state", None)
+                    if callable(dump_state) and counter["game"] % checkpoint.sync_every == 0:
+                        checkpoint.add_player_state(dump_state())
+        finally:
+            self.save_profiling()
+            self.close_results()
+
+            if replay_buffer is not None:
+                replay_buffer.close()
 
-                if not update:
-                    continue
+            if checkpoint:
+                dump_state = getattr(training_player, "dump_state", None)
+                if callable(dump_state):
+                    checkpoint.add_player_state(dump_state())
+
+                checkpoint.close()
+
+            if not self.quiet:
+                print()
+
+            print(
+                f"Partidas: {counter['game']}, Vitórias: {results[Color.BLACK]}, "
+                f"Derrotas: {results[Color.WHITE]}, Empates: {results[None]}"
+            )
 
     def ask_for_player(self, title: str, players: T.Sequence["ModuleInfo"]) -> "ModuleInfo":
         while True:
@@ -187,8 +388,11 @@ class ConsoleView(AbstractTrainingView):
         return input(f"{msg}: ")
 
     def update_line(self, msg: str) -> None:
-        terminal_size = get_terminal_size((80, 20))
-        print("\r" + msg.ljust(terminal_size.columns), end="")
+        if self._columns is None:
+            self._columns = get_terminal_size((80, 20)).columns
+
+        sys.stdout.write("\r" + msg.ljust(self._columns))
+        sys.stdout.flush()
 
 
 __all__ = ("ConsoleView",)
@@ -0,0 +1,29 @@
+# Internal
+import random
+import typing as T
+
+# External
+from othello.enums import Color
+from othello.models import Board
+
+
+def random_positions(
+    count: int, size: int = Board.SIZE, seed: int = 0, min_turns: int = 0
+) -> T.Iterator[T.Tuple[Board, Color]]:
+    # Boards reached by random legal moves, passes included, paired with the side to move. Games
+    # are cut at a random turn from min_turns on, so openings, middle games and finished games all
+    # show up
+    rng = random.Random(seed)
+    for _ in range(count):
+        board = Board(None, size)
+        color = Color.BLACK
+        for _ in range(rng.randrange(min_turns, board.MAX_TURNS + 1)):
+            moves = board.valid_moves(color)
+            if moves:
+                board.play(rng.choice(moves), color)
+            elif not board.valid_moves(color.opposite()):
+                break
+
+            color = color.opposite()
+
+        yield board, color
@@ -0,0 +1,64 @@
+# Internal
+from concurrent.futures import ThreadPoolExecutor
+
+# External
+from othello.enums import Color
+from othello.models import Board
+from othello.models.batch import apply_many, legal_moves_many
+from othello.models.bitboard import from_board
+
+# Project
+from .random_games import random_positions
+
+# Mixed sizes in the same call, each board is handled with its own geometry
+POSITIONS = [*random_positions(8, size=6, seed=3), *random_positions(8, seed=4)]
+
+
+def test_legal_moves_many() -> None:
+    boards = [board for board, _ in POSITIONS]
+    colors = [color for _, color in POSITIONS]
+    with ThreadPoolExecutor(2) as executor:
+        # Small chunks, so the executor splits the work
+        chunked = legal_moves_many(boards, colors, executor, chunk_size=3)
+
+    assert chunked == legal_moves_many(boards, colors)
+    for board, color, moves in zip(boards, colors, chunked):
+        assert len(moves) == len(set(moves))
+        assert set(moves) == set(board.valid_moves(color))
+
+
+def test_apply_many() -> None:
+    boards, moves, colors = [], [], []
+    for board, color in POSITIONS:
+        legal = set(board.valid_moves(color))
+        empty = [pos for pos in board.POSITIONS if board[pos] is Color.EMPTY and pos not in legal]
+        # Every legal move, an illegal one when there is any, and two off the board
+        for move in [*legal, *empty[:1], (0, 0), (board.size + 1, 1)]:
+            boards.append(board)
+            moves.append(move)
+            colors.append(color)
+
+    before = [from_board(board) for board in boards]
+    for board, move, color, played in zip(
+        boards, moves, colors, apply_many(boards, moves, colors)
+    ):
+        if move not in board.valid_moves(color):
+            assert played is None
+            continue
+
+        expected = board.get_clone().play(move, color)
+        assert played is not None
+        assert played.size == board.size
+        assert played.turns == expected.turns
+        assert from_board(played) == from_board(expected)
+
+    # Moves are played on copies
+    assert [from_board(board) for board in boards] == before
+
+
+def test_single_color() -> None:
+    # One color for every board
+    board = Board(None)
+    first, second = legal_moves_many([board, board], Color.BLACK)
+    assert first == second
+    assert set(first) == set(board.valid_moves(Color.BLACK))
@@ -0,0 +1,60 @@
+# External
+import pytest
+
+from othello.enums import Color
+from othello.models import Board
+from othello.models.codec import (
+    NO_MOVE,
+    POSITION,
+    decode,
+    encode,
+    encode_into,
+    decode_move,
+    encode_move,
+)
+from othello.models.bitboard import from_board
+
+# Project
+from .random_games import random_positions
+
+
+def test_round_trip() -> None:
+    for board, color in random_positions(15):
+        data = encode(board, color)
+        assert len(data) == POSITION.size == 18
+
+        decoded, decoded_color = decode(data)
+        assert decoded_color is color
+        assert decoded.turns == board.turns
+        assert from_board(decoded) == from_board(board)
+        assert all(decoded[pos] is board[pos] for pos in Board.POSITIONS)
+
+
+def test_round_trip_without_color() -> None:
+    for board, _ in random_positions(5, seed=1):
+        assert decode(board.to_bytes())[1] is None
+        assert from_board(Board.from_bytes(board.to_bytes())) == from_board(board)
+
+
+def test_encode_into_offset() -> None:
+    positions = list(random_positions(3, seed=2))
+    buffer = bytearray(POSITION.size * len(positions))
+    for index, (board, color) in enumerate(positions):
+        encode_into(buffer, index * POSITION.size, board, color)
+
+    for index, (board, color) in enumerate(positions):
+        assert decode(buffer, index * POSITION.size)[1] is color
+        assert buffer[index * POSITION.size : (index + 1) * POSITION.size] == encode(board, color)
+
+
+def test_moves() -> None:
+    assert encode_move(None) == NO_MOVE
+    assert decode_move(NO_MOVE) is None
+    assert sorted({encode_move(pos) for pos in Board.POSITIONS}) == list(range(64))
+    for pos in Board.POSITIONS:
+        assert decode_move(encode_move(pos)) == pos
+
+
+def test_other_sizes_rejected() -> None:
+    with pytest.raises(ValueError):
+        encode(Board(None, 6), Color.BLACK)
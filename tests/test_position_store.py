@@ -0,0 +1,84 @@
+# Internal
+import os
+import multiprocessing
+from pathlib import Path
+
+# External
+from othello.misc.position_store import EXACT, RECORD_SIZE, PositionStore
+
+
+def _append(path: str, positions: int, depth: int) -> None:
+    with PositionStore(path) as store:
+        for own in range(positions):
+            store.put(own, own + 1, float(own), depth)
+
+
+def _run(target: str, positions: int, depth: int) -> None:
+    process = multiprocessing.Process(target=_append, args=(target, positions, depth))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def test_refresh(tmp_path: Path) -> None:
+    path = str(tmp_path / "posicoes.bin")
+    with PositionStore(path) as store:
+        _run(path, 10, 3)
+        assert store.get(1, 2) is None
+
+        store.refresh()
+        assert len(store) == 10
+        assert store.get(1, 2) == (1.0, 3)
+
+
+def test_deeper_replaces_shallower(tmp_path: Path) -> None:
+    path = str(tmp_path / "posicoes.bin")
+    with PositionStore(path, batch_size=1) as store:
+        store.put(1, 2, 0.5, 2)
+        store.put(1, 2, 1.5, 5)
+        store.put(1, 2, 2.5, 3)
+        assert store.get(1, 2) == (1.5, 5)
+        assert store.get(1, 2, min_depth=6) is None
+
+        # Cached values give way to deeper ones written by another process
+        _run(path, 3, EXACT)
+        store.refresh()
+        entry = store.get(1, 2)
+        assert entry is not None and entry.exact and entry.value == 1.0
+
+    with PositionStore(path) as store:
+        assert store.get(1, 2) == (1.0, EXACT)
+
+
+def test_torn_tail(tmp_path: Path) -> None:
+    path = str(tmp_path / "posicoes.bin")
+    _run(path, 4, 1)
+    with open(path, "ab") as log:
+        # A writer that died in the middle of a record
+        log.write(b"\x01" * (RECORD_SIZE // 2))
+
+    with PositionStore(path) as store:
+        assert len(store) == 4
+        store.put(10, 11, 7.0, 1)
+
+    assert os.path.getsize(path) == 5 * RECORD_SIZE
+    with PositionStore(path) as store:
+        assert store.get(10, 11) == (7.0, 1)
+        assert store.get(3, 4) == (3.0, 1)
+
+
+def test_compact(tmp_path: Path) -> None:
+    path = str(tmp_path / "posicoes.bin")
+    with PositionStore(path, batch_size=1) as store:
+        for depth in range(1, 4):
+            for own in range(5):
+                store.put(own, own + 1, float(depth), depth)
+
+        assert os.path.getsize(path) == 15 * RECORD_SIZE
+        store.compact()
+        assert os.path.getsize(path) == 5 * RECORD_SIZE
+        assert store.get(4, 5) == (3.0, 3)
+
+    with PositionStore(path) as store:
+        assert len(store) == 5
+        assert all(store.get(own, own + 1) == (3.0, 3) for own in range(5))
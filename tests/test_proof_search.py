@@ -0,0 +1,97 @@
+# Internal
+import typing as T
+
+# External
+from othello.models.bitboard import Geometry, split, geometry, popcount, flips_mask, moves_mask
+from othello.models.proof_search import (
+    WIN,
+    DRAW,
+    LOSS,
+    MIN_TABLE_SIZE,
+    ProofNumberSearch,
+    board_outcome,
+)
+
+# Project
+from .random_games import random_positions
+
+MAX_EMPTIES = 9
+
+
+def exact(own: int, opp: int, geo: Geometry) -> int:
+    # Final disc difference for the side to move with perfect play, trying every line
+    moves = moves_mask(own, opp, geo)
+    if not moves:
+        if not moves_mask(opp, own, geo):
+            return popcount(own) - popcount(opp)
+        return -exact(opp, own, geo)
+
+    best = -geo.size * geo.size
+    while moves:
+        move = moves & -moves
+        moves ^= move
+        flips = flips_mask(own, opp, move, geo)
+        best = max(best, -exact(opp & ~flips, own | flips | move, geo))
+    return best
+
+
+def endgames(size: int, count: int, seed: int) -> T.List[T.Tuple[int, int, Geometry]]:
+    geo = geometry(size)
+    ret = []
+    for board, color in random_positions(
+        count, size, seed, min_turns=geo.size**2 - 4 - MAX_EMPTIES
+    ):
+        own, opp = split(board, color)
+        assert popcount(~(own | opp) & geo.full) <= MAX_EMPTIES
+        ret.append((own, opp, geo))
+    return ret
+
+
+ENDGAMES = endgames(4, 20, seed=5) + endgames(6, 10, seed=6)
+
+
+def test_outcome() -> None:
+    outcomes = {WIN: 0, DRAW: 0, LOSS: 0}
+    for own, opp, geo in ENDGAMES:
+        score = exact(own, opp, geo)
+        expected = WIN if score > 0 else (DRAW if score == 0 else LOSS)
+        assert ProofNumberSearch(geo=geo).outcome(own, opp) == expected
+        outcomes[expected] += 1
+
+    # Otherwise the positions would not tell the outcomes apart
+    assert outcomes[WIN] and outcomes[LOSS]
+
+
+def test_thresholds() -> None:
+    for own, opp, geo in ENDGAMES[::3]:
+        score = exact(own, opp, geo)
+        search = ProofNumberSearch(geo=geo)
+        for threshold in range(score - 2, score + 2):
+            assert search.prove(own, opp, threshold) is (score > threshold)
+
+
+def test_small_table() -> None:
+    # Entries get collected along the way, the answers must not change. Positions a bit earlier
+    # than the others, so the table fills up
+    geo = geometry(6)
+    small, large = ProofNumberSearch(MIN_TABLE_SIZE, geo), ProofNumberSearch(geo=geo)
+    for board, color in random_positions(3, 6, seed=8, min_turns=22):
+        own, opp = split(board, color)
+        assert small.outcome(own, opp) == large.outcome(own, opp)
+
+    assert small.collections
+
+
+def test_budget() -> None:
+    own, opp, geo = ENDGAMES[-1]
+    outcome = ProofNumberSearch(geo=geo).outcome(own, opp, budget=1)
+    assert outcome is None or outcome == ProofNumberSearch(geo=geo).outcome(own, opp)
+
+
+def test_board_outcome() -> None:
+    for board, color in random_positions(5, 6, seed=7, min_turns=27):
+        own, opp = split(board, color)
+        score = exact(own, opp, geometry(6))
+        assert board_outcome(board, color) == (
+            WIN if score > 0 else (DRAW if score == 0 else LOSS)
+        )